@@ -0,0 +1,146 @@
+"""
+ProDegeit Project - Numeric Kernels
+Compiled inner loops for scheduling passes (Numba-accelerated when available)
+"""
+
+import numpy as np
+
+from data_models import ACTIVITIES, DURATIONS, PRED_INDPTR, PRED_INDICES
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator: run the kernel as plain Python"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def cpm(durations, pred_indptr, pred_indices):
+    """
+    Forward CPM pass over the CSR predecessor graph
+
+    Activities must be ordered so every predecessor precedes its successors
+    (true for ACTIVITIES, whose ids are topologically ordered).
+
+    Args:
+        durations: int32 array of activity durations in working days
+        pred_indptr: CSR row pointers, length n_activities + 1
+        pred_indices: CSR column indices (0-based activity indices)
+
+    Returns:
+        Tuple of (early_start, early_finish) int32 arrays in working days
+    """
+    n = durations.shape[0]
+    early_start = np.zeros(n, np.int32)
+    early_finish = np.zeros(n, np.int32)
+
+    for i in range(n):
+        start = 0
+        for k in range(pred_indptr[i], pred_indptr[i + 1]):
+            pred = pred_indices[k]
+            if early_finish[pred] > start:
+                start = early_finish[pred]
+        early_start[i] = start
+        early_finish[i] = start + durations[i]
+
+    return early_start, early_finish
+
+
+@njit(cache=True)
+def cpm_backward(durations, pred_indptr, pred_indices, project_end):
+    """
+    Backward CPM pass over the CSR predecessor graph
+
+    Walks the activities in reverse topological order, relaxing each
+    predecessor's latest finish against the successor's latest start.
+
+    Args:
+        durations: int32 array of activity durations in working days
+        pred_indptr: CSR row pointers, length n_activities + 1
+        pred_indices: CSR column indices (0-based activity indices)
+        project_end: Project finish in working days (early_finish.max())
+
+    Returns:
+        Tuple of (late_start, late_finish) int32 arrays in working days
+    """
+    n = durations.shape[0]
+    late_finish = np.full(n, project_end, np.int32)
+    late_start = np.zeros(n, np.int32)
+
+    for i in range(n - 1, -1, -1):
+        late_start[i] = late_finish[i] - durations[i]
+        for k in range(pred_indptr[i], pred_indptr[i + 1]):
+            pred = pred_indices[k]
+            if late_start[i] < late_finish[pred]:
+                late_finish[pred] = late_start[i]
+
+    return late_start, late_finish
+
+
+@njit(cache=True)
+def cpm_calendar(durations, pred_indptr, pred_indices):
+    """
+    Forward CPM pass on calendar-day offsets from PROJECT_START
+
+    Works entirely on int32 day offsets - PROJECT_START is a Monday, so
+    weekday is just offset % 7 and the weekend skip is closed-form int
+    arithmetic, with no datetime/timedelta objects inside the loop.
+    Matches the allocator's weekday-only rule (holidays not excluded).
+
+    Args:
+        durations: int32 array of activity durations in working days
+        pred_indptr: CSR row pointers, length n_activities + 1
+        pred_indices: CSR column indices (0-based activity indices)
+
+    Returns:
+        Tuple of (start_day, end_day) int32 calendar-day offsets
+    """
+    n = durations.shape[0]
+    start_day = np.zeros(n, np.int32)
+    end_day = np.zeros(n, np.int32)
+
+    for i in range(n):
+        earliest = 0
+        for k in range(pred_indptr[i], pred_indptr[i + 1]):
+            pred = pred_indices[k]
+            if end_day[pred] > earliest:
+                earliest = end_day[pred]
+
+        # Snap weekend starts to Monday
+        weekday = earliest % 7
+        if weekday > 4:
+            earliest += 7 - weekday
+
+        # Advance durations[i] working days: whole weeks cost 7 calendar
+        # days per 5 working days, the remainder lands within the week
+        q, r = divmod(earliest % 7 + durations[i], 5)
+        start_day[i] = earliest
+        end_day[i] = earliest - earliest % 7 + q * 7 + r
+
+    return start_day, end_day
+
+
+if __name__ == "__main__":
+    print("ProDegeit CPM Kernel")
+    print("=" * 50)
+    print(f"Numba available: {NUMBA_AVAILABLE}")
+
+    es, ef = cpm(DURATIONS, PRED_INDPTR, PRED_INDICES)
+    ls, lf = cpm_backward(DURATIONS, PRED_INDPTR, PRED_INDICES, int(ef.max()))
+    print(f"\nProject length (working days): {int(ef.max())}")
+    for activity, start, finish, late in zip(ACTIVITIES, es, ef, ls):
+        slack = int(late - start)
+        print(f"  #{activity.id:2d} {activity.name[:40]:40s} "
+              f"ES={start:3d} EF={finish:3d} slack={slack:3d}")
+
+    sd, ed = cpm_calendar(DURATIONS, PRED_INDPTR, PRED_INDICES)
+    print(f"\nProject length (calendar days, weekends skipped): {int(ed.max())}")
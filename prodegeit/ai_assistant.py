@@ -5,20 +5,23 @@ Uses Gemini 2.0 Flash for intelligent content generation
 
 import os
 import sys
-from typing import List, Dict, Optional
+import asyncio
+import functools
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Dict, Iterator, Optional
 import google.generativeai as genai
 from dotenv import load_dotenv
 
-# Load environment variables
-env_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
-load_dotenv(env_path)
 
-# Configure Gemini API
-GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
-if not GOOGLE_API_KEY:
-    print("WARNING: GOOGLE_API_KEY not found in .env file")
-else:
-    genai.configure(api_key=GOOGLE_API_KEY)
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """Load the shared .env file once, on first use (not at import)"""
+    load_dotenv(os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'))
+    return os.environ
 
 # Model configuration - Try Gemini 3 Pro first, fallback to 2.5 Pro
 MODEL_PRIORITY = [
@@ -27,19 +30,36 @@ MODEL_PRIORITY = [
     "gemini-2.0-flash-exp"       # Final fallback: Gemini 2.0 Flash
 ]
 
-GENERATION_CONFIG = {
+# Cache for the last-known-good model name, so the singleton skips the
+# probe round-trips on every process start
+MODEL_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'prodegeit',
+                                'gemini_model.json')
+MODEL_CACHE_TTL_SECONDS = 86400  # 1 day
+
+# On-disk cache of generated text keyed by prompt hash. Unchanged inputs
+# build byte-identical prompts, so repeated runs skip the API (and its
+# token cost) entirely.
+RESPONSE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'prodegeit',
+                                  'responses')
+RESPONSE_CACHE_TTL_SECONDS = 7 * 86400  # 7 days
+
+# Frozen so accidental mutation can't desynchronise the cached models
+# (the SDK reads these, it never mutates them)
+GENERATION_CONFIG = MappingProxyType({
     "temperature": 0.7,
     "top_p": 0.95,
     "top_k": 40,
     "max_output_tokens": 2048,
-}
+})
 
-SAFETY_SETTINGS = [
+# Tuple rather than list; inner dicts stay plain because the SDK's
+# safety-setting parser only understands real dicts
+SAFETY_SETTINGS = (
     {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_ONLY_HIGH"},
     {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_ONLY_HIGH"},
     {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_ONLY_HIGH"},
     {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_ONLY_HIGH"},
-]
+)
 
 # Gemini API Pricing (as of Nov 2025, per million tokens)
 # Source: https://ai.google.dev/pricing
@@ -50,6 +70,158 @@ API_PRICING = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _available_model_names() -> frozenset:
+    """Model names this API key can call generateContent on
+
+    One metadata round-trip instead of a test generation per candidate.
+    """
+    return frozenset(
+        m.name.split('/')[-1]
+        for m in genai.list_models()
+        if 'generateContent' in m.supported_generation_methods
+    )
+
+
+@functools.lru_cache(maxsize=len(MODEL_PRIORITY))
+def _build_model(model_name: str):
+    """Construct a GenerativeModel once per model name and reuse it"""
+    return genai.GenerativeModel(
+        model_name=model_name,
+        generation_config=GENERATION_CONFIG,
+        safety_settings=SAFETY_SETTINGS
+    )
+
+
+# LRU cache of generated text keyed by (model_name, prompt). Activities or
+# risks with identical inputs produce identical prompts, so repeats skip
+# the API round-trip entirely.
+_PROMPT_CACHE_MAX = 512
+_prompt_cache = OrderedDict()
+
+# Prompt templates, parsed once at import time. The generate_* methods
+# fill them with str.format instead of rebuilding large f-strings per call.
+EXECUTIVE_SUMMARY_TMPL = """
+You are a project management expert writing an executive summary for a project plan.
+
+Project: ProDegeit - Equipment Acquisition and Installation
+Start Date: {start_date}
+Deadline: {deadline}
+Budget: €{budget_max:,} (€{budget_with_reserve:,} with 10% reserve)
+
+Project Status:
+- Total Activities: {total_activities}
+- Resources Allocated: {total_resources}
+- Estimated Total Cost: €{estimated_cost:,.2f}
+- Projected Completion: {completion_date}
+- Budget Status: {budget_status}
+- Timeline Status: {timeline_status}
+
+Risk Analysis:
+- Identified Risks: {total_risks}
+- Total Expected Risk Cost (before mitigation): €{total_expected_cost:,.2f}
+- Mitigation Cost: €{mitigation_cost:,.2f}
+- Expected Risk Cost (after mitigation): €{expected_cost_after:,.2f}
+
+Write a professional, concise executive summary (250-300 words) that:
+1. States the project objective clearly
+2. Highlights key achievements in planning
+3. Summarizes resource allocation approach
+4. Mentions risk mitigation strategy
+5. Confirms feasibility within budget and timeline constraints
+6. Provides confidence level for successful delivery
+
+Use professional project management terminology. Be specific with numbers.
+"""
+
+RESOURCE_JUSTIFICATION_TMPL = """
+You are a project manager explaining resource allocation decisions.
+
+Activity: #{activity_id} - {activity_name}
+Duration: {duration} days
+Required People: {num_people}
+Skill Requirements: {skill_requirements}
+
+Assigned Resources:
+{resources_info}
+
+Write a brief justification (2-3 sentences) explaining why these specific resources were assigned to this activity. Focus on:
+1. How their skills match the requirements
+2. Cost-effectiveness
+3. Availability considerations
+
+Be concise and professional.
+"""
+
+RISK_NARRATIVE_TMPL = """
+You are a risk management expert documenting a project risk.
+
+Risk: {risk_name}
+Activity: #{activity_id}
+Probability: {probability_pct}%
+Impact: €{cost_impact:,} / {time_impact} days
+
+Selected Mitigation: {mitigation_name}
+Mitigation Cost: €{mitigation_cost:,}
+Expected Reduction: €{cost_reduction:,} / {time_reduction} days
+
+Scenario Analysis:
+- Without mitigation: Expected cost = €{without_mitigation:,.2f}
+- With mitigation: Expected cost = €{with_mitigation:,.2f}
+- Net benefit: €{net_benefit:,.2f}
+
+Write a professional risk narrative (3-4 sentences) that:
+1. Describes the risk and its potential impact
+2. Explains the chosen mitigation strategy
+3. Justifies the decision with cost-benefit analysis
+
+Be specific and use project management terminology.
+"""
+
+CONCLUSIONS_TMPL = """
+You are a senior project manager writing the conclusions section of a project plan.
+
+Budget Analysis:
+- Allocated: €{allocated:,.2f}
+- Limit: €{limit:,.2f}
+- Remaining: €{remaining:,.2f}
+- Status: {budget_status}
+
+Timeline Analysis:
+- Projected Completion: {projected_completion}
+- Deadline: {deadline}
+- Buffer: {buffer_days} days
+- Status: {timeline_status}
+
+Key Recommendations:
+{recommendations_text}
+
+Write a professional conclusions section (200-250 words) that:
+1. Assesses overall project viability
+2. Highlights critical success factors
+3. Identifies key risks to monitor
+4. Provides specific recommendations for execution phase
+5. Expresses confidence level in successful delivery
+
+Use authoritative, professional language appropriate for senior management review.
+"""
+
+BEST_PRACTICES_TMPL = """
+You are a PMBOK-certified project management consultant.
+
+Project Context: {project_context}
+
+List 5 specific project management best practices that are most relevant to this project.
+Each practice should be:
+- Specific and actionable
+- Based on PMBOK or other recognized PM frameworks
+- Relevant to resource allocation, risk management, or schedule management
+- No more than one sentence each
+
+Format as a numbered list.
+"""
+
+
 class AIAssistant:
     """AI Assistant using Gemini for content generation"""
     
@@ -60,33 +232,88 @@ class AIAssistant:
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.total_cost = 0.0
-        
-        # Try models in priority order
+        # Bounds the number of concurrent LLM calls in the async API
+        self._sem = asyncio.Semaphore(4)
+
+        # Configure the Gemini API on first use
+        _load_env()
+        api_key = os.getenv('GOOGLE_API_KEY')
+        if not api_key:
+            print("WARNING: GOOGLE_API_KEY not found in .env file")
+            self.model = None
+            return
+        genai.configure(api_key=api_key)
+
+        # Fast path: reuse the last-known-good model without probing
+        cached_name = self._load_cached_model_name()
+        if cached_name:
+            try:
+                self.model = _build_model(cached_name)
+                self.available = True
+                self.model_name = cached_name
+                print(f"✓ Using cached model {cached_name}")
+                return
+            except Exception as e:
+                print(f"✗ Cached model {cached_name} failed: {e}")
+                self._invalidate_model_cache()
+
+        # One capability listing instead of a test generation per model
+        try:
+            available_names = _available_model_names()
+        except Exception as e:
+            print(f"✗ Could not list Gemini models: {e}")
+            available_names = frozenset()
+
+        # Pick the first priority model this key can actually use
         for model_name in MODEL_PRIORITY:
+            if model_name not in available_names:
+                print(f"✗ {model_name} not available")
+                continue
             try:
-                print(f"Attempting to initialize {model_name}...")
-                self.model = genai.GenerativeModel(
-                    model_name=model_name,
-                    generation_config=GENERATION_CONFIG,
-                    safety_settings=SAFETY_SETTINGS
-                )
-                # Test the model with a simple request
-                test_response = self.model.generate_content("Test")
-                
-                # If successful, use this model
+                self.model = _build_model(model_name)
                 self.available = True
                 self.model_name = model_name
                 print(f"✓ Successfully initialized {model_name}")
+                self._save_model_cache(model_name)
                 break
-                
             except Exception as e:
                 print(f"✗ {model_name} not available: {e}")
                 continue
-        
+
         if not self.available:
             print(f"WARNING: Could not initialize any Gemini model")
             self.model = None
-    
+
+    def _load_cached_model_name(self) -> Optional[str]:
+        """Read the cached model name if fresh and still in MODEL_PRIORITY"""
+        try:
+            with open(MODEL_CACHE_PATH, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if (time.time() - entry.get('ts', 0) < MODEL_CACHE_TTL_SECONDS
+                    and entry.get('model') in MODEL_PRIORITY):
+                return entry['model']
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _save_model_cache(self, model_name: str):
+        """Persist the working model name (atomic replace)"""
+        try:
+            os.makedirs(os.path.dirname(MODEL_CACHE_PATH), exist_ok=True)
+            tmp_path = MODEL_CACHE_PATH + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'model': model_name, 'ts': time.time()}, f)
+            os.replace(tmp_path, MODEL_CACHE_PATH)
+        except OSError:
+            pass  # Cache is best-effort
+
+    def _invalidate_model_cache(self):
+        """Drop the cached model name so the next start re-probes"""
+        try:
+            os.remove(MODEL_CACHE_PATH)
+        except OSError:
+            pass
+
     def _track_tokens(self, response):
         """Track token usage from API response"""
         try:
@@ -118,89 +345,227 @@ class AIAssistant:
             'pricing': API_PRICING.get(self.model_name, {"input": 0, "output": 0})
         }
     
-    def generate_executive_summary(self, project_data: Dict, allocation_results: Dict, 
+    def _response_cache_path(self, prompt: str) -> str:
+        """Build the response cache file path for a (model, prompt) key"""
+        key = f"{self.model_name}\x00{prompt}"
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(RESPONSE_CACHE_DIR, f"{digest}.txt")
+
+    @staticmethod
+    def _response_cache_read(path: str) -> Optional[str]:
+        """Read a cached response if present and not expired"""
+        try:
+            if time.time() - os.path.getmtime(path) < RESPONSE_CACHE_TTL_SECONDS:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return f.read()
+        except OSError:
+            pass
+        return None
+
+    @staticmethod
+    def _response_cache_write(path: str, text: str):
+        """Persist a generated response (atomic replace, best-effort)"""
+        try:
+            os.makedirs(RESPONSE_CACHE_DIR, exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _generate(self, prompt: str) -> str:
+        """
+        Generate text for a prompt, deduplicating identical prompts
+
+        Identical prompts return the cached text without touching the API:
+        first from the in-process LRU, then from the hash-keyed disk cache
+        that survives across runs.
+        """
+        key = (self.model_name, prompt)
+        cached = _prompt_cache.get(key)
+        if cached is not None:
+            _prompt_cache.move_to_end(key)
+            return cached
+
+        cache_path = self._response_cache_path(prompt)
+        text = self._response_cache_read(cache_path)
+        if text is None:
+            response = self.model.generate_content(prompt)
+            self._track_tokens(response)
+            text = response.text
+            self._response_cache_write(cache_path, text)
+
+        _prompt_cache[key] = text
+        if len(_prompt_cache) > _PROMPT_CACHE_MAX:
+            _prompt_cache.popitem(last=False)
+
+        return text
+
+    def _generate_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Yield generated text chunk by chunk as it arrives
+
+        Lets callers start writing output before the full response has
+        been received, hiding LLM latency behind downstream I/O. Cached
+        responses are yielded as a single chunk; API responses are
+        cached once the stream is exhausted.
+        """
+        key = (self.model_name, prompt)
+        cached = _prompt_cache.get(key)
+        if cached is None:
+            cached = self._response_cache_read(self._response_cache_path(prompt))
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        response = self.model.generate_content(prompt, stream=True)
+        for chunk in response:
+            if chunk.text:
+                chunks.append(chunk.text)
+                yield chunk.text
+        self._track_tokens(response)
+
+        text = ''.join(chunks)
+        self._response_cache_write(self._response_cache_path(prompt), text)
+        _prompt_cache[key] = text
+        if len(_prompt_cache) > _PROMPT_CACHE_MAX:
+            _prompt_cache.popitem(last=False)
+
+    async def _agenerate(self, prompt: str) -> str:
+        """
+        Run one generation call in a worker thread under the semaphore
+
+        google-generativeai has no native async API, so the blocking call
+        is offloaded via asyncio.to_thread; the semaphore keeps at most a
+        handful of calls in flight.
+        """
+        async with self._sem:
+            return await asyncio.to_thread(self._generate, prompt)
+
+    async def agenerate_all(self, project_data: Dict, allocation_results: Dict,
+                            risk_analysis: Dict, budget_status: Dict,
+                            timeline_status: Dict, recommendations: List[str]) -> Dict:
+        """
+        Generate the executive summary and conclusions concurrently
+
+        Both sections are independent LLM calls with seconds of latency
+        each; running them under asyncio.gather collapses the total wait
+        to roughly one call.
+
+        Returns:
+            Dict with 'executive_summary' and 'conclusions' text
+        """
+        if not self.available:
+            return {
+                'executive_summary': self._fallback_executive_summary(
+                    project_data, allocation_results, risk_analysis),
+                'conclusions': self._fallback_conclusions(
+                    budget_status, timeline_status, recommendations),
+            }
+
+        summary_prompt = self._build_executive_summary_prompt(
+            project_data, allocation_results, risk_analysis)
+        conclusions_prompt = self._build_conclusions_prompt(
+            budget_status, timeline_status, recommendations)
+
+        summary, conclusions = await asyncio.gather(
+            self._agenerate(summary_prompt),
+            self._agenerate(conclusions_prompt),
+            return_exceptions=True
+        )
+
+        if isinstance(summary, Exception):
+            print(f"Error generating executive summary: {summary}")
+            self._invalidate_model_cache()
+            summary = self._fallback_executive_summary(
+                project_data, allocation_results, risk_analysis)
+        if isinstance(conclusions, Exception):
+            print(f"Error generating conclusions: {conclusions}")
+            self._invalidate_model_cache()
+            conclusions = self._fallback_conclusions(
+                budget_status, timeline_status, recommendations)
+
+        return {'executive_summary': summary, 'conclusions': conclusions}
+
+    def generate_executive_summary(self, project_data: Dict, allocation_results: Dict,
                                    risk_analysis: Dict) -> str:
         """Generate executive summary for the project report"""
         if not self.available:
             return self._fallback_executive_summary(project_data, allocation_results, risk_analysis)
-        
-        prompt = f"""
-You are a project management expert writing an executive summary for a project plan.
 
-Project: ProDegeit - Equipment Acquisition and Installation
-Start Date: {project_data['start_date']}
-Deadline: {project_data['deadline']}
-Budget: €{project_data['budget_max']:,} (€{project_data['budget_with_reserve']:,} with 10% reserve)
+        prompt = self._build_executive_summary_prompt(project_data, allocation_results, risk_analysis)
 
-Project Status:
-- Total Activities: {allocation_results['total_activities']}
-- Resources Allocated: {allocation_results['total_resources']}
-- Estimated Total Cost: €{allocation_results['estimated_cost']:,.2f}
-- Projected Completion: {allocation_results['completion_date']}
-- Budget Status: {allocation_results['budget_status']}
-- Timeline Status: {allocation_results['timeline_status']}
+        try:
+            return self._generate(prompt)
+        except Exception as e:
+            print(f"Error generating executive summary: {e}")
+            self._invalidate_model_cache()
+            return self._fallback_executive_summary(project_data, allocation_results, risk_analysis)
 
-Risk Analysis:
-- Identified Risks: {risk_analysis['total_risks']}
-- Total Expected Risk Cost (before mitigation): €{risk_analysis['total_expected_cost']:,.2f}
-- Mitigation Cost: €{risk_analysis['mitigation_cost']:,.2f}
-- Expected Risk Cost (after mitigation): €{risk_analysis['expected_cost_after']:,.2f}
+    def generate_executive_summary_stream(self, project_data: Dict, allocation_results: Dict,
+                                          risk_analysis: Dict) -> Iterator[str]:
+        """Stream the executive summary as it is generated"""
+        if not self.available:
+            yield self._fallback_executive_summary(project_data, allocation_results, risk_analysis)
+            return
 
-Write a professional, concise executive summary (250-300 words) that:
-1. States the project objective clearly
-2. Highlights key achievements in planning
-3. Summarizes resource allocation approach
-4. Mentions risk mitigation strategy
-5. Confirms feasibility within budget and timeline constraints
-6. Provides confidence level for successful delivery
+        prompt = self._build_executive_summary_prompt(project_data, allocation_results, risk_analysis)
 
-Use professional project management terminology. Be specific with numbers.
-"""
-        
         try:
-            response = self.model.generate_content(prompt)
-            self._track_tokens(response)
-            return response.text
+            yield from self._generate_stream(prompt)
         except Exception as e:
             print(f"Error generating executive summary: {e}")
-            return self._fallback_executive_summary(project_data, allocation_results, risk_analysis)
-    
+            self._invalidate_model_cache()
+            yield self._fallback_executive_summary(project_data, allocation_results, risk_analysis)
+
+    def _build_executive_summary_prompt(self, project_data: Dict, allocation_results: Dict,
+                                        risk_analysis: Dict) -> str:
+        """Build the executive summary prompt"""
+        return EXECUTIVE_SUMMARY_TMPL.format(
+            start_date=project_data['start_date'],
+            deadline=project_data['deadline'],
+            budget_max=project_data['budget_max'],
+            budget_with_reserve=project_data['budget_with_reserve'],
+            total_activities=allocation_results['total_activities'],
+            total_resources=allocation_results['total_resources'],
+            estimated_cost=allocation_results['estimated_cost'],
+            completion_date=allocation_results['completion_date'],
+            budget_status=allocation_results['budget_status'],
+            timeline_status=allocation_results['timeline_status'],
+            total_risks=risk_analysis['total_risks'],
+            total_expected_cost=risk_analysis['total_expected_cost'],
+            mitigation_cost=risk_analysis['mitigation_cost'],
+            expected_cost_after=risk_analysis['expected_cost_after'],
+        )
+
     def generate_resource_justification(self, activity: Dict, assigned_resources: List[Dict],
                                        skill_requirements: Dict[str, int]) -> str:
         """Generate justification for resource allocation to an activity"""
         if not self.available:
             return self._fallback_resource_justification(activity, assigned_resources, skill_requirements)
         
-        resources_info = "\n".join([
+        # Generator avoids materialising an intermediate list per call
+        resources_info = "\n".join(
             f"- {r['name']}: Cost €{r['cost']}/h, Skills: {r['skills']}"
             for r in assigned_resources
-        ])
-        
-        prompt = f"""
-You are a project manager explaining resource allocation decisions.
+        )
 
-Activity: #{activity['id']} - {activity['name']}
-Duration: {activity['duration']} days
-Required People: {activity['num_people']}
-Skill Requirements: {skill_requirements}
+        prompt = RESOURCE_JUSTIFICATION_TMPL.format(
+            activity_id=activity['id'],
+            activity_name=activity['name'],
+            duration=activity['duration'],
+            num_people=activity['num_people'],
+            skill_requirements=skill_requirements,
+            resources_info=resources_info,
+        )
 
-Assigned Resources:
-{resources_info}
-
-Write a brief justification (2-3 sentences) explaining why these specific resources were assigned to this activity. Focus on:
-1. How their skills match the requirements
-2. Cost-effectiveness
-3. Availability considerations
-
-Be concise and professional.
-"""
-        
         try:
-            response = self.model.generate_content(prompt)
-            self._track_tokens(response)
-            return response.text.strip()
+            return self._generate(prompt).strip()
         except Exception as e:
             print(f"Error generating resource justification: {e}")
+            self._invalidate_model_cache()
             return self._fallback_resource_justification(activity, assigned_resources, skill_requirements)
     
     def generate_risk_narrative(self, risk: Dict, selected_mitigation: Dict, 
@@ -209,37 +574,26 @@ Be concise and professional.
         if not self.available:
             return self._fallback_risk_narrative(risk, selected_mitigation, scenario_analysis)
         
-        prompt = f"""
-You are a risk management expert documenting a project risk.
-
-Risk: {risk['name']}
-Activity: #{risk['activity_id']}
-Probability: {risk['probability']*100}%
-Impact: €{risk['cost_impact']:,} / {risk['time_impact']} days
-
-Selected Mitigation: {selected_mitigation['name']}
-Mitigation Cost: €{selected_mitigation['cost']:,}
-Expected Reduction: €{selected_mitigation['cost_reduction']:,} / {selected_mitigation['time_reduction']} days
-
-Scenario Analysis:
-- Without mitigation: Expected cost = €{scenario_analysis['without_mitigation']:,.2f}
-- With mitigation: Expected cost = €{scenario_analysis['with_mitigation']:,.2f}
-- Net benefit: €{scenario_analysis['net_benefit']:,.2f}
-
-Write a professional risk narrative (3-4 sentences) that:
-1. Describes the risk and its potential impact
-2. Explains the chosen mitigation strategy
-3. Justifies the decision with cost-benefit analysis
-
-Be specific and use project management terminology.
-"""
+        prompt = RISK_NARRATIVE_TMPL.format(
+            risk_name=risk['name'],
+            activity_id=risk['activity_id'],
+            probability_pct=risk['probability'] * 100,
+            cost_impact=risk['cost_impact'],
+            time_impact=risk['time_impact'],
+            mitigation_name=selected_mitigation['name'],
+            mitigation_cost=selected_mitigation['cost'],
+            cost_reduction=selected_mitigation['cost_reduction'],
+            time_reduction=selected_mitigation['time_reduction'],
+            without_mitigation=scenario_analysis['without_mitigation'],
+            with_mitigation=scenario_analysis['with_mitigation'],
+            net_benefit=scenario_analysis['net_benefit'],
+        )
         
         try:
-            response = self.model.generate_content(prompt)
-            self._track_tokens(response)
-            return response.text.strip()
+            return self._generate(prompt).strip()
         except Exception as e:
             print(f"Error generating risk narrative: {e}")
+            self._invalidate_model_cache()
             return self._fallback_risk_narrative(risk, selected_mitigation, scenario_analysis)
     
     def generate_conclusions(self, budget_status: Dict, timeline_status: Dict,
@@ -247,72 +601,62 @@ Be specific and use project management terminology.
         """Generate conclusions section for the report"""
         if not self.available:
             return self._fallback_conclusions(budget_status, timeline_status, recommendations)
-        
-        prompt = f"""
-You are a senior project manager writing the conclusions section of a project plan.
 
-Budget Analysis:
-- Allocated: €{budget_status['allocated']:,.2f}
-- Limit: €{budget_status['limit']:,.2f}
-- Remaining: €{budget_status['remaining']:,.2f}
-- Status: {budget_status['status']}
+        prompt = self._build_conclusions_prompt(budget_status, timeline_status, recommendations)
 
-Timeline Analysis:
-- Projected Completion: {timeline_status['projected_completion']}
-- Deadline: {timeline_status['deadline']}
-- Buffer: {timeline_status['buffer_days']} days
-- Status: {timeline_status['status']}
+        try:
+            return self._generate(prompt)
+        except Exception as e:
+            print(f"Error generating conclusions: {e}")
+            self._invalidate_model_cache()
+            return self._fallback_conclusions(budget_status, timeline_status, recommendations)
 
-Key Recommendations:
-{chr(10).join([f'- {rec}' for rec in recommendations])}
+    def generate_conclusions_stream(self, budget_status: Dict, timeline_status: Dict,
+                                    recommendations: List[str]) -> Iterator[str]:
+        """Stream the conclusions section as it is generated"""
+        if not self.available:
+            yield self._fallback_conclusions(budget_status, timeline_status, recommendations)
+            return
 
-Write a professional conclusions section (200-250 words) that:
-1. Assesses overall project viability
-2. Highlights critical success factors
-3. Identifies key risks to monitor
-4. Provides specific recommendations for execution phase
-5. Expresses confidence level in successful delivery
+        prompt = self._build_conclusions_prompt(budget_status, timeline_status, recommendations)
 
-Use authoritative, professional language appropriate for senior management review.
-"""
-        
         try:
-            response = self.model.generate_content(prompt)
-            self._track_tokens(response)
-            return response.text
+            yield from self._generate_stream(prompt)
         except Exception as e:
             print(f"Error generating conclusions: {e}")
-            return self._fallback_conclusions(budget_status, timeline_status, recommendations)
-    
+            self._invalidate_model_cache()
+            yield self._fallback_conclusions(budget_status, timeline_status, recommendations)
+
+    def _build_conclusions_prompt(self, budget_status: Dict, timeline_status: Dict,
+                                  recommendations: List[str]) -> str:
+        """Build the conclusions prompt"""
+        return CONCLUSIONS_TMPL.format(
+            allocated=budget_status['allocated'],
+            limit=budget_status['limit'],
+            remaining=budget_status['remaining'],
+            budget_status=budget_status['status'],
+            projected_completion=timeline_status['projected_completion'],
+            deadline=timeline_status['deadline'],
+            buffer_days=timeline_status['buffer_days'],
+            timeline_status=timeline_status['status'],
+            recommendations_text="\n".join(f"- {rec}" for rec in recommendations),
+        )
+
     def generate_best_practices(self, project_context: str) -> List[str]:
         """Generate project management best practices relevant to the context"""
         if not self.available:
             return self._fallback_best_practices()
         
-        prompt = f"""
-You are a PMBOK-certified project management consultant.
-
-Project Context: {project_context}
-
-List 5 specific project management best practices that are most relevant to this project.
-Each practice should be:
-- Specific and actionable
-- Based on PMBOK or other recognized PM frameworks
-- Relevant to resource allocation, risk management, or schedule management
-- No more than one sentence each
-
-Format as a numbered list.
-"""
+        prompt = BEST_PRACTICES_TMPL.format(project_context=project_context)
         
         try:
-            response = self.model.generate_content(prompt)
-            self._track_tokens(response)
-            practices = response.text.strip().split('\n')
+            practices = self._generate(prompt).strip().split('\n')
             # Clean up and filter
             practices = [p.strip() for p in practices if p.strip() and any(c.isalpha() for c in p)]
             return practices[:5]
         except Exception as e:
             print(f"Error generating best practices: {e}")
+            self._invalidate_model_cache()
             return self._fallback_best_practices()
     
     # Fallback methods (when AI is not available)
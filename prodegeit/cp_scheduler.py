@@ -0,0 +1,112 @@
+"""
+ProDegeit Project - CP-SAT Schedule Optimizer
+Optional exact scheduler built on Google OR-Tools (used when installed)
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from data_models import Activity, Resource, ACTIVITIES, RESOURCES
+
+try:
+    from ortools.sat.python import cp_model
+    CPSAT_AVAILABLE = True
+except ImportError:
+    cp_model = None
+    CPSAT_AVAILABLE = False
+
+
+def solve_schedule(activities: List[Activity] = ACTIVITIES,
+                   resources: List[Resource] = RESOURCES,
+                   num_workers: Optional[int] = None) -> Optional[Dict]:
+    """
+    Solve the activity schedule exactly with CP-SAT
+
+    Builds one interval per activity with precedence constraints, models
+    each feasible resource-to-activity assignment as an optional interval
+    under a per-resource NoOverlap, and minimizes the makespan with
+    parallel search workers. The greedy allocator remains the default
+    path; this solver is consulted only when OR-Tools is installed.
+
+    Args:
+        activities: List of project activities
+        resources: List of available resources
+        num_workers: Search workers (defaults to the CPU count)
+
+    Returns:
+        Dict of {activity_id: (start_day, end_day)} in working-day
+        offsets, or None if OR-Tools is missing or no solution was found
+    """
+    if not CPSAT_AVAILABLE:
+        return None
+
+    model = cp_model.CpModel()
+    horizon = sum(a.duration_days for a in activities)
+
+    starts, ends, intervals = {}, {}, {}
+    for activity in activities:
+        start = model.NewIntVar(0, horizon, f"start_{activity.id}")
+        end = model.NewIntVar(0, horizon, f"end_{activity.id}")
+        starts[activity.id] = start
+        ends[activity.id] = end
+        intervals[activity.id] = model.NewIntervalVar(
+            start, activity.duration_days, end, f"interval_{activity.id}")
+
+    # Finish-to-start precedence
+    for activity in activities:
+        for pred_id in activity.predecessors:
+            model.Add(starts[activity.id] >= ends[pred_id])
+
+    # One optional interval per feasible (activity, resource) pair plus a
+    # NoOverlap per resource: disjunctive with optional intervals
+    # propagates far better than a single cumulative with 0/1 demands
+    intervals_by_resource = {idx: [] for idx in range(len(resources))}
+    for activity in activities:
+        pair_presences = []
+        for idx, resource in enumerate(resources):
+            if not resource.feasible(activity):
+                continue
+            presence = model.NewBoolVar(f"assign_{activity.id}_{idx}")
+            intervals_by_resource[idx].append(model.NewOptionalIntervalVar(
+                starts[activity.id], activity.duration_days, ends[activity.id],
+                presence, f"opt_{activity.id}_{idx}"))
+            pair_presences.append(presence)
+
+        # Staff the activity fully, or with every feasible resource when
+        # the pool cannot cover the requested headcount
+        if pair_presences:
+            model.Add(sum(pair_presences)
+                      == min(activity.num_people, len(pair_presences)))
+
+    for resource_intervals in intervals_by_resource.values():
+        if len(resource_intervals) > 1:
+            model.AddNoOverlap(resource_intervals)
+
+    makespan = model.NewIntVar(0, horizon, "makespan")
+    model.AddMaxEquality(makespan, [ends[a.id] for a in activities])
+    model.Minimize(makespan)
+
+    solver = cp_model.CpSolver()
+    solver.parameters.num_search_workers = num_workers or (os.cpu_count() or 1)
+    status = solver.Solve(model)
+
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return None
+
+    return {a.id: (solver.Value(starts[a.id]), solver.Value(ends[a.id]))
+            for a in activities}
+
+
+if __name__ == "__main__":
+    print("ProDegeit CP-SAT Schedule Optimizer")
+    print("=" * 50)
+    print(f"OR-Tools available: {CPSAT_AVAILABLE}")
+
+    solution = solve_schedule()
+    if solution is None:
+        print("! No CP-SAT solution (OR-Tools missing or infeasible)")
+    else:
+        makespan = max(end for _, end in solution.values())
+        print(f"\nMakespan (working days): {makespan}")
+        for activity_id, (start, end) in sorted(solution.items()):
+            print(f"  Activity {activity_id:2d}: day {start:3d} -> {end:3d}")
@@ -3,9 +3,12 @@ ProDegeit Project - Data Models
 Defines all project data including activities, resources, risks, and constants
 """
 
+import functools
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
+import numpy as np
+
 # Project Constants
 PROJECT_START = datetime(2026, 1, 5)  # Monday, 5 January 2026
 PROJECT_DEADLINE = datetime(2026, 3, 21)  # Saturday, 21 March 2026
@@ -24,6 +27,44 @@ HOLIDAYS_2026 = [
     datetime(2026, 4, 25),  # Freedom Day (after project end)
 ]
 
+# datetime64[D] mirrors of the date constants for vectorized date math
+PROJECT_START_D = np.datetime64(PROJECT_START, 'D')
+PROJECT_DEADLINE_D = np.datetime64(PROJECT_DEADLINE, 'D')
+HOLIDAYS_2026_D = np.array([np.datetime64(holiday, 'D') for holiday in HOLIDAYS_2026])
+
+
+def to_day_index(date: datetime) -> int:
+    """Calendar-day offset of a datetime from PROJECT_START"""
+    return (date - PROJECT_START).days
+
+
+def from_day_index(day_idx: int) -> datetime:
+    """Datetime at the given calendar-day offset from PROJECT_START"""
+    return PROJECT_START + timedelta(days=int(day_idx))
+
+
+# Business-day calendar over the project horizon (index 0 = PROJECT_START).
+# The horizon extends past the deadline so delayed schedules still resolve.
+HORIZON_DAYS = (PROJECT_DEADLINE - PROJECT_START).days + 90
+_DATES_D = PROJECT_START_D + np.arange(HORIZON_DAYS)
+# Days since the Unix epoch (a Thursday), shifted so Monday == 0
+_DOW = (_DATES_D.astype(np.int64) + 3) % 7
+BUSINESS_MASK = (_DOW < 5) & ~np.isin(_DATES_D, HOLIDAYS_2026_D)
+# CUM_BUSINESS[i] = number of business days in days 0..i inclusive
+CUM_BUSINESS = np.cumsum(BUSINESS_MASK)
+
+
+def add_business_days(start_idx: int, n: int) -> int:
+    """
+    Day index reached after advancing n business days from start_idx
+
+    Returns the smallest index whose cumulative business-day count is n
+    greater than at start_idx, replacing the day-by-day advance loop.
+    """
+    target = CUM_BUSINESS[start_idx] + n
+    return int(np.searchsorted(CUM_BUSINESS, target))
+
+
 # Skill Categories (0-6 scale)
 SKILL_PETROLEUM = "Petroleum Technology"
 SKILL_CONSTRUCTION = "Construction"
@@ -33,9 +74,40 @@ SKILL_HR = "Human Resources"
 
 ALL_SKILLS = [SKILL_PETROLEUM, SKILL_CONSTRUCTION, SKILL_FINANCE, SKILL_PROCUREMENT, SKILL_HR]
 
+# Sentinel for match_score: surplus can legitimately go negative (a resource
+# may hold a required skill below the required level), so sit well under the
+# minimum possible surplus of -6 * len(ALL_SKILLS)
+MATCH_INFEASIBLE = -100
+
+# Fixed skill ordering so skill dicts can be mirrored as small int vectors
+SKILL_IDX = {skill: idx for idx, skill in enumerate(ALL_SKILLS)}
+
+
+def _skill_vec(levels: Dict[str, int]) -> np.ndarray:
+    """Convert a {skill: level} dict to an int8 vector ordered by SKILL_IDX"""
+    vec = np.zeros(len(ALL_SKILLS), dtype=np.int8)
+    for skill, level in levels.items():
+        vec[SKILL_IDX[skill]] = level
+    return vec
+
+
+def _skill_mask(levels: Dict[str, int]) -> int:
+    """Bit-pack a {skill: level} dict: bit i set when skill i has level > 0"""
+    return sum(1 << SKILL_IDX[skill] for skill, level in levels.items() if level > 0)
+
+
+@functools.lru_cache(maxsize=None)
+def _requirements_vec(items: tuple) -> np.ndarray:
+    """Cached requirement vector for a sorted tuple of (skill, level) pairs"""
+    return _skill_vec(dict(items))
+
 
 class Activity:
     """Represents a project activity/task"""
+    __slots__ = ("id", "name", "duration_days", "num_people", "predecessors",
+                 "skill_requirements", "req_vec", "req_mask", "assigned_resources",
+                 "start_date", "end_date", "total_hours")
+
     def __init__(self, id: int, name: str, duration_days: int, 
                  num_people: int, predecessors: List[int],
                  skill_requirements: Dict[str, int]):
@@ -45,6 +117,8 @@ class Activity:
         self.num_people = num_people
         self.predecessors = predecessors
         self.skill_requirements = skill_requirements
+        self.req_vec = _skill_vec(skill_requirements)
+        self.req_mask = _skill_mask(skill_requirements)
         self.assigned_resources = []
         self.start_date = None
         self.end_date = None
@@ -53,9 +127,26 @@ class Activity:
     def __repr__(self):
         return f"Activity({self.id}: {self.name}, {self.duration_days}d, {self.num_people}p)"
 
+    def clone(self) -> "Activity":
+        """
+        Independent copy with fresh allocation state
+
+        All fields are primitives except the two containers copied here,
+        so an explicit rebuild is far cheaper than copy.deepcopy's
+        reflective walk.
+        """
+        return Activity(self.id, self.name, self.duration_days,
+                        self.num_people, list(self.predecessors),
+                        dict(self.skill_requirements))
+
 
 class Resource:
     """Represents a project resource/team member"""
+    __slots__ = ("name", "cost_per_hour", "availability_pct", "start_week",
+                 "vacation_weeks", "_vac", "avail_mask", "skills", "skill_vec",
+                 "skill_mask", "is_core_team", "assigned_tasks", "total_hours",
+                 "total_cost")
+
     def __init__(self, name: str, cost_per_hour: float, availability_pct: float,
                  start_week: int, vacation_weeks: List[int], skills: Dict[str, int],
                  is_core_team: bool = False):
@@ -64,7 +155,14 @@ class Resource:
         self.availability_pct = availability_pct
         self.start_week = start_week
         self.vacation_weeks = vacation_weeks
+        self._vac = frozenset(vacation_weeks)
+        # Bit w set when the resource is available in week w (1-52)
+        self.avail_mask = sum(
+            1 << week for week in range(start_week, 53) if week not in self._vac
+        )
         self.skills = skills
+        self.skill_vec = _skill_vec(skills)
+        self.skill_mask = _skill_mask(skills)
         self.is_core_team = is_core_team
         self.assigned_tasks = []
         self.total_hours = 0
@@ -72,40 +170,54 @@ class Resource:
         
     def __repr__(self):
         return f"Resource({self.name}, €{self.cost_per_hour}/h, {self.availability_pct*100}%)"
+
+    def clone(self) -> "Resource":
+        """Independent copy with fresh assignment state (see Activity.clone)"""
+        return Resource(self.name, self.cost_per_hour, self.availability_pct,
+                        self.start_week, list(self.vacation_weeks),
+                        dict(self.skills), self.is_core_team)
     
     def is_available(self, week: int) -> bool:
         """Check if resource is available in given week"""
-        if week < self.start_week:
-            return False
-        if week in self.vacation_weeks:
-            return False
-        return True
+        return bool(self.avail_mask >> week & 1) if week > 0 else False
     
     def can_take_task(self, max_tasks: int = 6) -> bool:
         """Check if resource can take another task"""
         return len(self.assigned_tasks) < max_tasks
     
+    def feasible(self, activity: "Activity") -> bool:
+        """Branchless capability check: every required skill held at some level"""
+        return (activity.req_mask & ~self.skill_mask) == 0
+
+    def match_score(self, activity: "Activity") -> int:
+        """
+        Skill match as a single int: MATCH_INFEASIBLE when a required skill
+        is missing, otherwise the total skill surplus over the requirements
+        (which may be negative)
+        """
+        if activity.req_mask & ~self.skill_mask:
+            return MATCH_INFEASIBLE
+        need = activity.req_vec > 0
+        return int((self.skill_vec - activity.req_vec)[need].sum())
+
     def matches_skills(self, requirements: Dict[str, int]) -> tuple[bool, int]:
         """
         Check if resource matches skill requirements
         Returns: (matches: bool, skill_surplus: int)
         """
-        matches = True
-        surplus = 0
-        
-        for skill, required_level in requirements.items():
-            if required_level > 0:  # Only check if skill is required
-                resource_level = self.skills.get(skill, 0)
-                if resource_level == 0:  # Resource doesn't have required skill
-                    matches = False
-                    return (False, 0)
-                surplus += (resource_level - required_level)
-        
-        return (matches, surplus)
+        req = _requirements_vec(tuple(sorted(requirements.items())))
+        need = req > 0  # Only check skills that are actually required
+        if np.any(need & (self.skill_vec == 0)):  # Missing a required skill
+            return (False, 0)
+        return (True, int((self.skill_vec - req)[need].sum()))
 
 
 class Risk:
     """Represents a project risk"""
+    __slots__ = ("id", "name", "activity_id", "probability", "cost_impact",
+                 "time_impact_days", "mitigation_options", "selected_mitigation",
+                 "_ev")
+
     def __init__(self, id: int, name: str, activity_id: int, 
                  probability: float, cost_impact: float, time_impact_days: int,
                  mitigation_options: List[Dict]):
@@ -117,13 +229,14 @@ class Risk:
         self.time_impact_days = time_impact_days
         self.mitigation_options = mitigation_options
         self.selected_mitigation = None
+        self._ev = probability * cost_impact
         
     def __repr__(self):
         return f"Risk({self.name}, P={self.probability*100}%, Impact=€{self.cost_impact})"
     
     def expected_value(self) -> float:
-        """Calculate expected monetary value of risk"""
-        return self.probability * self.cost_impact
+        """Expected monetary value of risk (computed once at construction)"""
+        return self._ev
 
 
 # Define all 17 activities
@@ -249,22 +362,100 @@ RISKS = [
 ]
 
 
+# Risk data mirrored as ndarrays for vectorized scenario evaluation:
+# RISK_MATRIX rows are (probability, cost_impact, time_impact_days);
+# MITIG_MATRIX[risk, option] is (cost, cost_reduction, time_reduction)
+RISK_MATRIX = np.array(
+    [(risk.probability, risk.cost_impact, risk.time_impact_days) for risk in RISKS]
+)
+MITIG_MATRIX = np.array(
+    [[(option['cost'], option['cost_reduction'], option['time_reduction'])
+      for option in risk.mitigation_options]
+     for risk in RISKS]
+)
+
+
+# Predecessor graph flattened once into CSR arrays. Activity ids are 1-based
+# and contiguous, so row i of the graph is the activity with id i+1.
+DURATIONS = np.array([activity.duration_days for activity in ACTIVITIES], dtype=np.int32)
+
+PRED_INDPTR = np.zeros(len(ACTIVITIES) + 1, dtype=np.int32)
+for _activity in ACTIVITIES:
+    PRED_INDPTR[_activity.id] = len(_activity.predecessors)
+PRED_INDPTR = np.cumsum(PRED_INDPTR).astype(np.int32)
+
+PRED_INDICES = np.fromiter(
+    (pred - 1 for activity in ACTIVITIES for pred in activity.predecessors),
+    dtype=np.int32,
+)
+
+# Transposed graph (successors per activity) for backward passes
+SUCC_INDPTR = np.zeros(len(ACTIVITIES) + 1, dtype=np.int32)
+for _activity in ACTIVITIES:
+    for _pred in _activity.predecessors:
+        SUCC_INDPTR[_pred] += 1
+SUCC_INDPTR = np.cumsum(SUCC_INDPTR).astype(np.int32)
+
+SUCC_INDICES = np.zeros(len(PRED_INDICES), dtype=np.int32)
+_fill = SUCC_INDPTR[:-1].copy()
+for _activity in ACTIVITIES:
+    for _pred in _activity.predecessors:
+        SUCC_INDICES[_fill[_pred - 1]] = _activity.id - 1
+        _fill[_pred - 1] += 1
+del _fill
+
+
+# Structure-of-arrays mirror of ACTIVITIES for serialization hot loops:
+# generators can zip primitive parallel arrays instead of doing repeated
+# attribute lookups on Activity objects
+ACTIVITY_SOA = {
+    'id': np.array([activity.id for activity in ACTIVITIES], dtype=np.int32),
+    'name': [activity.name for activity in ACTIVITIES],
+    'duration_days': DURATIONS,
+    'predecessors': [activity.predecessors for activity in ACTIVITIES],
+}
+
+
+@functools.lru_cache(maxsize=1)
+def build_feasibility() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build the full (resources x activities) feasibility and surplus matrices
+    in one broadcast instead of looping over matches_skills
+
+    Returns:
+        Tuple of (feasible_mat, surplus_mat) with shape (R, A)
+    """
+    need = REQ_MATRIX > 0
+    feasible_mat = ~(need & (RES_SKILLS[:, None, :] == 0)).any(axis=2)
+    surplus_mat = ((RES_SKILLS[:, None, :].astype(np.int16) - REQ_MATRIX) * need).sum(axis=2)
+    return feasible_mat, surplus_mat
+
+
+def rebuild_indexes():
+    """Rebuild lookup indexes and skill matrices (call after mutating ACTIVITIES/RESOURCES)"""
+    global _ACTIVITY_BY_ID, _RESOURCE_BY_NAME, REQ_MATRIX, RES_SKILLS
+    _ACTIVITY_BY_ID = {activity.id: activity for activity in ACTIVITIES}
+    _RESOURCE_BY_NAME = {resource.name: resource for resource in RESOURCES}
+    # Skill matrices (rows follow list order above) for vectorized matching
+    REQ_MATRIX = np.stack([activity.req_vec for activity in ACTIVITIES])
+    RES_SKILLS = np.stack([resource.skill_vec for resource in RESOURCES])
+    build_feasibility.cache_clear()
+
+
+rebuild_indexes()
+
+
 def get_activity_by_id(activity_id: int) -> Optional[Activity]:
-    """Get activity by ID"""
-    for activity in ACTIVITIES:
-        if activity.id == activity_id:
-            return activity
-    return None
+    """Get activity by ID (dict lookup, rebuilt by rebuild_indexes)"""
+    return _ACTIVITY_BY_ID.get(activity_id)
 
 
 def get_resource_by_name(name: str) -> Optional[Resource]:
-    """Get resource by name"""
-    for resource in RESOURCES:
-        if resource.name == name:
-            return resource
-    return None
+    """Get resource by name (dict lookup, rebuilt by rebuild_indexes)"""
+    return _RESOURCE_BY_NAME.get(name)
 
 
+@functools.lru_cache(maxsize=1)
 def calculate_project_weeks() -> int:
     """Calculate number of weeks in project"""
     delta = PROJECT_DEADLINE - PROJECT_START
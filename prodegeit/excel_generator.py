@@ -3,312 +3,352 @@ ProDegeit Project - Excel Generator
 Creates comprehensive Excel reports
 """
 
+import functools
 from typing import Dict, List
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
 from data_models import ACTIVITIES, RESOURCES, ALL_SKILLS
 
+# Skill level (0-6) -> color, replacing the old if/elif color ladder
+SKILL_COLOR = ["FFFFFF", "FFF2CC", "FFF2CC", "FFD966", "FFD966", "92D050", "92D050"]
+
+# Number formats so Excel stores real numbers instead of pre-formatted text
+EURO_FORMAT = '"€"#,##0.00'
+HOURS_FORMAT = '0.0'
+
+
+@functools.lru_cache(maxsize=1)
+def _lazy_styles() -> dict:
+    """
+    Build the shared style palette on first use
+
+    openpyxl import is deferred to here so callers that never generate a
+    workbook (e.g. pure data_models consumers) skip the import cost, and the
+    immutable style objects are built once and reused across all cells.
+    """
+    from openpyxl.styles import Font, PatternFill, Alignment
+
+    return {
+        'HEADER_FONT': Font(color="FFFFFF", bold=True),
+        'HEADER_FILL_BLUE': PatternFill(start_color="4472C4", fill_type="solid"),
+        'HEADER_FILL_GREEN': PatternFill(start_color="70AD47", fill_type="solid"),
+        'BOLD_FONT': Font(bold=True),
+        'BOLD_LARGE_FONT': Font(bold=True, size=12),
+        'SMALL_FONT': Font(size=9),
+        'SMALL_BOLD_FONT': Font(bold=True, size=9),
+        'CENTER': Alignment(horizontal="center"),
+        'CENTER_ROTATED': Alignment(horizontal="center", text_rotation=90),
+        'AVAILABLE_FILL': PatternFill(start_color="C6E0B4", fill_type="solid"),
+        'UNAVAILABLE_FILL': PatternFill(start_color="F4B084", fill_type="solid"),
+        'CHECK_FILL': PatternFill(start_color="92D050", fill_type="solid"),
+        'SKILL_FILL': [PatternFill(start_color=color, fill_type="solid")
+                       for color in SKILL_COLOR],
+    }
+
 
 class ExcelGenerator:
     """Generates Excel workbooks for project data"""
-    
+
     def __init__(self):
         """Initialize Excel generator"""
         pass
-    
+
+    def _styled(self, ws, value, font=None, fill=None, alignment=None, number_format=None):
+        """Build a WriteOnlyCell with the given styles attached before append"""
+        from openpyxl.cell import WriteOnlyCell
+
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        if number_format is not None:
+            cell.number_format = number_format
+        return cell
+
     def generate_resource_workbook(self, output_path: str):
         """
         Generate resource data workbook
-        
+
         Args:
             output_path: Path to save Excel file
         """
+        import openpyxl
+
         print(f"\nGenerating Resource Excel: {output_path}")
-        
-        wb = openpyxl.Workbook()
-        
-        # Remove default sheet
-        wb.remove(wb.active)
-        
+
+        # Write-only mode streams rows to disk instead of keeping a cell grid
+        wb = openpyxl.Workbook(write_only=True)
+
         # Sheet 1: Resource Master Data
         self._create_resource_sheet(wb)
-        
+
         # Sheet 2: Skill Matrix
         self._create_skill_matrix_sheet(wb)
-        
+
         # Sheet 3: Availability Calendar
         self._create_availability_sheet(wb)
-        
+
         wb.save(output_path)
         print(f"✓ Resource workbook generated")
-    
+
     def generate_allocation_workbook(self, allocation_results: Dict, output_path: str):
         """
         Generate allocation results workbook
-        
+
         Args:
             allocation_results: Results from resource allocator
             output_path: Path to save Excel file
         """
+        import openpyxl
+
         print(f"\nGenerating Allocation Excel: {output_path}")
-        
-        wb = openpyxl.Workbook()
-        wb.remove(wb.active)
-        
+
+        wb = openpyxl.Workbook(write_only=True)
+
         # Sheet 1: Activity List
         self._create_activity_sheet(wb, allocation_results)
-        
+
         # Sheet 2: Allocation Matrix
         self._create_allocation_matrix_sheet(wb, allocation_results)
-        
+
         # Sheet 3: Resource Utilization
         self._create_utilization_sheet(wb, allocation_results)
-        
+
         # Sheet 4: Cost Summary
         self._create_cost_sheet(wb, allocation_results)
-        
+
         wb.save(output_path)
         print(f"✓ Allocation workbook generated")
-    
+
     def _create_resource_sheet(self, wb):
         """Create resource master data sheet"""
+        from openpyxl.utils import get_column_letter
+
+        styles = _lazy_styles()
         ws = wb.create_sheet("Resources")
-        
-        # Headers
-        headers = ["Name", "Cost/Hour (€)", "Availability %", "Start Week", 
+
+        headers = ["Name", "Cost/Hour (€)", "Availability %", "Start Week",
                   "Vacation Weeks", "Core Team"]
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(1, col, header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="4472C4", fill_type="solid")
-            cell.font = Font(color="FFFFFF", bold=True)
-        
-        # Data
-        for row, resource in enumerate(RESOURCES, start=2):
-            ws.cell(row, 1, resource.name)
-            ws.cell(row, 2, resource.cost_per_hour)
-            ws.cell(row, 3, f"{resource.availability_pct*100}%")
-            ws.cell(row, 4, resource.start_week)
-            ws.cell(row, 5, ", ".join(map(str, resource.vacation_weeks)) if resource.vacation_weeks else "-")
-            ws.cell(row, 6, "Yes" if resource.is_core_team else "No")
-        
-        # Auto-size columns
+
+        # Column widths must be set before rows are streamed
         for col in range(1, len(headers) + 1):
             ws.column_dimensions[get_column_letter(col)].width = 15
-    
+
+        # Headers
+        ws.append([self._styled(ws, header, font=styles['HEADER_FONT'],
+                                fill=styles['HEADER_FILL_BLUE'])
+                   for header in headers])
+
+        # Data - one append per row instead of per-cell writes
+        for resource in RESOURCES:
+            ws.append([
+                resource.name,
+                resource.cost_per_hour,
+                f"{resource.availability_pct*100}%",
+                resource.start_week,
+                ", ".join(map(str, resource.vacation_weeks)) if resource.vacation_weeks else "-",
+                "Yes" if resource.is_core_team else "No",
+            ])
+
     def _create_skill_matrix_sheet(self, wb):
         """Create skill matrix heat map"""
+        from openpyxl.utils import get_column_letter
+
+        styles = _lazy_styles()
         ws = wb.create_sheet("Skill Matrix")
-        
-        # Headers
-        ws.cell(1, 1, "Resource")
-        for col, skill in enumerate(ALL_SKILLS, start=2):
-            cell = ws.cell(1, col, skill)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="70AD47", fill_type="solid")
-            cell.font = Font(color="FFFFFF", bold=True)
-        
-        # Data with conditional formatting
-        for row, resource in enumerate(RESOURCES, start=2):
-            ws.cell(row, 1, resource.name).font = Font(bold=True)
-            
-            for col, skill in enumerate(ALL_SKILLS, start=2):
-                level = resource.skills.get(skill, 0)
-                cell = ws.cell(row, col, level if level > 0 else "-")
-                
-                # Color code by skill level
-                if level == 0:
-                    color = "FFFFFF"
-                elif level <= 2:
-                    color = "FFF2CC"
-                elif level <= 4:
-                    color = "FFD966"
-                else:
-                    color = "92D050"
-                
-                cell.fill = PatternFill(start_color=color, fill_type="solid")
-                cell.alignment = Alignment(horizontal="center")
-        
-        # Auto-size
+
         ws.column_dimensions['A'].width = 15
         for col in range(2, len(ALL_SKILLS) + 2):
             ws.column_dimensions[get_column_letter(col)].width = 18
-    
+
+        # Headers
+        ws.append(["Resource"] +
+                  [self._styled(ws, skill, font=styles['HEADER_FONT'],
+                                fill=styles['HEADER_FILL_GREEN'])
+                   for skill in ALL_SKILLS])
+
+        # Data rows, color coded by skill level via the SKILL_FILL lookup table
+        for resource in RESOURCES:
+            levels = [resource.skills.get(skill, 0) for skill in ALL_SKILLS]
+            ws.append([self._styled(ws, resource.name, font=styles['BOLD_FONT'])] +
+                      [self._styled(ws, level if level > 0 else "-",
+                                    fill=styles['SKILL_FILL'][level],
+                                    alignment=styles['CENTER'])
+                       for level in levels])
+
     def _create_availability_sheet(self, wb):
         """Create availability calendar"""
+        from openpyxl.formatting.rule import CellIsRule
+        from openpyxl.utils import get_column_letter
+
+        styles = _lazy_styles()
         ws = wb.create_sheet("Availability")
-        
-        # Headers
-        ws.cell(1, 1, "Resource")
-        for week in range(1, 13):  # 12 week project
-            cell = ws.cell(1, week + 1, f"Week {week}")
-            cell.font = Font(bold=True, size=9)
-            cell.alignment = Alignment(horizontal="center")
-        
-        # Data
-        for row, resource in enumerate(RESOURCES, start=2):
-            ws.cell(row, 1, resource.name)
-            
-            for week in range(1, 13):
-                cell = ws.cell(row, week + 1)
-                
-                if resource.is_available(week):
-                    cell.value = f"{int(resource.availability_pct*100)}%"
-                    cell.fill = PatternFill(start_color="C6E0B4", fill_type="solid")
-                else:
-                    cell.value = "N/A"
-                    cell.fill = PatternFill(start_color="F4B084", fill_type="solid")
-                
-                cell.alignment = Alignment(horizontal="center")
-                cell.font = Font(size=9)
-        
+
         ws.column_dimensions['A'].width = 15
         for col in range(2, 14):
             ws.column_dimensions[get_column_letter(col)].width = 8
-    
+
+        # Green/orange fills come from the two rules
+        data_range = f"B2:M{len(RESOURCES) + 1}"
+        ws.conditional_formatting.add(data_range, CellIsRule(
+            operator="equal", formula=['"N/A"'],
+            fill=styles['UNAVAILABLE_FILL']))
+        ws.conditional_formatting.add(data_range, CellIsRule(
+            operator="notEqual", formula=['"N/A"'],
+            fill=styles['AVAILABLE_FILL']))
+
+        # Headers
+        ws.append(["Resource"] +
+                  [self._styled(ws, f"Week {week}", font=styles['SMALL_BOLD_FONT'],
+                                alignment=styles['CENTER'])
+                   for week in range(1, 13)])  # 12 week project
+
+        # Data
+        for resource in RESOURCES:
+            pct = f"{int(resource.availability_pct*100)}%"
+            ws.append([resource.name] +
+                      [self._styled(ws, pct if resource.is_available(week) else "N/A",
+                                    font=styles['SMALL_FONT'],
+                                    alignment=styles['CENTER'])
+                       for week in range(1, 13)])
+
     def _create_activity_sheet(self, wb, results):
         """Create activity list sheet"""
+        from openpyxl.utils import get_column_letter
+
+        styles = _lazy_styles()
         ws = wb.create_sheet("Activities")
-        
-        # Headers
-        headers = ["ID", "Activity Name", "Duration (days)", "Predecessors", 
+
+        headers = ["ID", "Activity Name", "Duration (days)", "Predecessors",
                   "Start Date", "End Date", "Allocated Resources"]
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(1, col, header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="4472C4", fill_type="solid")
-            cell.font = Font(color="FFFFFF", bold=True)
-        
+
+        for col in range(1, len(headers) + 1):
+            ws.column_dimensions[get_column_letter(col)].width = 20 if col == 2 else 15
+
+        # Headers
+        ws.append([self._styled(ws, header, font=styles['HEADER_FONT'],
+                                fill=styles['HEADER_FILL_BLUE'])
+                   for header in headers])
+
         # Data
         for activity in ACTIVITIES:
-            row = activity.id + 1
             schedule = results['schedule'].get(activity.id, {})
             allocated = results['allocation_map'].get(activity.id, [])
-            
-            ws.cell(row, 1, activity.id)
-            ws.cell(row, 2, activity.name)
-            ws.cell(row, 3, activity.duration_days)
-            ws.cell(row, 4, ", ".join(map(str, activity.predecessors)) if activity.predecessors else "-")
-            ws.cell(row, 5, schedule.get('start', '-').strftime("%Y-%m-%d") if schedule.get('start') else "-")
-            ws.cell(row, 6, schedule.get('end', '-').strftime("%Y-%m-%d") if schedule.get('end') else "-")
-            ws.cell(row, 7, ", ".join(allocated) if allocated else "-")
-        
-        # Auto-size
-        for col in range(1, len(headers) + 1):
-            ws.column_dimensions[get_column_letter(col)].width = 20 if col == 2 else 15
-    
+
+            ws.append([
+                activity.id,
+                activity.name,
+                activity.duration_days,
+                ", ".join(map(str, activity.predecessors)) if activity.predecessors else "-",
+                schedule['start'].strftime("%Y-%m-%d") if schedule.get('start') else "-",
+                schedule['end'].strftime("%Y-%m-%d") if schedule.get('end') else "-",
+                ", ".join(allocated) if allocated else "-",
+            ])
+
     def _create_allocation_matrix_sheet(self, wb, results):
         """Create resource allocation matrix"""
+        from openpyxl.formatting.rule import CellIsRule
+        from openpyxl.utils import get_column_letter
+
+        styles = _lazy_styles()
         ws = wb.create_sheet("Allocation Matrix")
-        
-        # Headers - Activities across top
-        ws.cell(1, 1, "Resource \\ Activity")
-        for col, activity in enumerate(ACTIVITIES, start=2):
-            cell = ws.cell(1, col, f"A{activity.id}")
-            cell.font = Font(bold=True, size=9)
-            cell.alignment = Alignment(horizontal="center", text_rotation=90)
+
+        ws.column_dimensions['A'].width = 15
+        for col in range(2, len(ACTIVITIES) + 2):
             ws.column_dimensions[get_column_letter(col)].width = 4
-        
-        # Add totals column
-        ws.cell(1, len(ACTIVITIES) + 2, "Total Tasks")
-        ws.cell(1, len(ACTIVITIES) + 3, "Total Hours")
-        
+        # One row-level height for the rotated header instead of per-cell sizing
+        ws.row_dimensions[1].height = 60
+
+        # The check-mark fill comes from one rule
+        matrix_range = f"B2:{get_column_letter(len(ACTIVITIES) + 1)}{len(RESOURCES) + 1}"
+        ws.conditional_formatting.add(matrix_range, CellIsRule(
+            operator="equal", formula=['"✓"'],
+            fill=styles['CHECK_FILL']))
+
+        # Headers - Activities across top
+        ws.append(["Resource \\ Activity"] +
+                  [self._styled(ws, f"A{activity.id}", font=styles['SMALL_BOLD_FONT'],
+                                alignment=styles['CENTER_ROTATED'])
+                   for activity in ACTIVITIES] +
+                  ["Total Tasks", "Total Hours"])
+
         # Resource rows
-        for row, resource in enumerate(RESOURCES, start=2):
-            ws.cell(row, 1, resource.name).font = Font(bold=True)
-            
-            task_count = 0
-            for col, activity in enumerate(ACTIVITIES, start=2):
-                allocated = results['allocation_map'].get(activity.id, [])
-                
-                if resource.name in allocated:
-                    cell = ws.cell(row, col, "✓")
-                    cell.fill = PatternFill(start_color="92D050", fill_type="solid")
-                    cell.alignment = Alignment(horizontal="center")
-                    task_count += 1
-                else:
-                    ws.cell(row, col, "")
-            
-            # Totals
+        for resource in RESOURCES:
+            marks = ["✓" if resource.name in results['allocation_map'].get(activity.id, [])
+                     else "" for activity in ACTIVITIES]
             util = results['resource_utilization'].get(resource.name, {})
-            ws.cell(row, len(ACTIVITIES) + 2, task_count)
-            ws.cell(row, len(ACTIVITIES) + 3, f"{util.get('hours', 0):.0f}")
-        
-        ws.column_dimensions['A'].width = 15
-    
+            ws.append([self._styled(ws, resource.name, font=styles['BOLD_FONT'])] + marks +
+                      [marks.count("✓"),
+                       self._styled(ws, util.get('hours', 0), number_format='0')])
+
     def _create_utilization_sheet(self, wb, results):
         """Create resource utilization summary"""
+        from openpyxl.utils import get_column_letter
+
+        styles = _lazy_styles()
         ws = wb.create_sheet("Utilization")
-        
-        # Headers
+
         headers = ["Resource", "Total Hours", "Total Cost (€)", "Number of Tasks"]
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(1, col, header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="70AD47", fill_type="solid")
-            cell.font = Font(color="FFFFFF", bold=True)
-        
-        # Data
-        row = 2
-        for resource_name, util in sorted(
-            results['resource_utilization'].items(),
-            key=lambda x: x[1]['cost'],
-            reverse=True
-        ):
-            ws.cell(row, 1, resource_name)
-            ws.cell(row, 2, f"{util['hours']:.1f}")
-            ws.cell(row, 3, f"€{util['cost']:,.2f}")
-            ws.cell(row, 4, util['tasks'])
-            row += 1
-        
-        # Total row
-        row += 1
-        ws.cell(row, 1, "TOTAL").font = Font(bold=True)
-        ws.cell(row, 3, f"€{results['estimated_cost']:,.2f}").font = Font(bold=True)
-        
-        for col in range(1, 5):
+
+        for col in range(1, len(headers) + 1):
             ws.column_dimensions[get_column_letter(col)].width = 18
-    
+
+        # Headers
+        ws.append([self._styled(ws, header, font=styles['HEADER_FONT'],
+                                fill=styles['HEADER_FILL_GREEN'])
+                   for header in headers])
+
+        # Data (already sorted by cost, descending, by the allocator)
+        for resource_name, util in results['resource_utilization'].items():
+            ws.append([resource_name,
+                       self._styled(ws, util['hours'], number_format=HOURS_FORMAT),
+                       self._styled(ws, util['cost'], number_format=EURO_FORMAT),
+                       util['tasks']])
+
+        # Total row
+        ws.append([])
+        ws.append([self._styled(ws, "TOTAL", font=styles['BOLD_FONT']), None,
+                   self._styled(ws, results['estimated_cost'], font=styles['BOLD_FONT'],
+                                number_format=EURO_FORMAT)])
+
     def _create_cost_sheet(self, wb, results):
         """Create cost breakdown sheet"""
+        styles = _lazy_styles()
         ws = wb.create_sheet("Cost Analysis")
-        
+
+        ws.column_dimensions['A'].width = 12
+        ws.column_dimensions['B'].width = 35
+        ws.column_dimensions['C'].width = 18
+
         # Headers
-        ws.cell(1, 1, "Activity ID").font = Font(bold=True)
-        ws.cell(1, 2, "Activity Name").font = Font(bold=True)
-        ws.cell(1, 3, "Cost (€)").font = Font(bold=True)
-        
+        ws.append([self._styled(ws, header, font=styles['BOLD_FONT'])
+                   for header in ["Activity ID", "Activity Name", "Cost (€)"]])
+
         # Data
-        row = 2
         for activity in ACTIVITIES:
             cost = results['activity_costs'].get(activity.id, 0)
-            ws.cell(row, 1, activity.id)
-            ws.cell(row, 2, activity.name)
-            ws.cell(row, 3, f"€{cost:,.2f}")
-            row += 1
-        
+            ws.append([activity.id, activity.name,
+                       self._styled(ws, cost, number_format=EURO_FORMAT)])
+
         # Core team cost
-        row += 1
-        ws.cell(row, 2, "Core Team (Fixed)").font = Font(bold=True)
-        ws.cell(row, 3, f"€{results['core_team_cost']:,.2f}").font = Font(bold=True)
-        
+        ws.append([])
+        ws.append([None, self._styled(ws, "Core Team (Fixed)", font=styles['BOLD_FONT']),
+                   self._styled(ws, results['core_team_cost'], font=styles['BOLD_FONT'],
+                                number_format=EURO_FORMAT)])
+
         # Total
-        row += 1
-        ws.cell(row, 2, "TOTAL PROJECT COST").font = Font(bold=True, size=12)
-        ws.cell(row, 3, f"€{results['estimated_cost']:,.2f}").font = Font(bold=True, size=12)
-        
-        ws.column_dimensions['A'].width = 12
-        ws.column_dimensions['B'].width = 35
-        ws.column_dimensions['C'].width = 18
+        ws.append([None, self._styled(ws, "TOTAL PROJECT COST", font=styles['BOLD_LARGE_FONT']),
+                   self._styled(ws, results['estimated_cost'], font=styles['BOLD_LARGE_FONT'],
+                                number_format=EURO_FORMAT)])
 
 
 if __name__ == "__main__":
     print("Testing Excel Generator...")
-    
+
     generator = ExcelGenerator()
-    
+
     # Generate resource workbook
     generator.generate_resource_workbook("output/ProDegeit_Resources.xlsx")
-    
+
     print("\n✓ Excel generator test complete")
@@ -5,6 +5,7 @@ Coordinates all modules to generate complete project plan
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import argparse
 
@@ -14,10 +15,10 @@ from data_models import (
 )
 from resource_allocator import run_allocation
 from risk_analyzer import run_risk_analysis
-from ms_project_generator import generate_ms_project_xml
-from excel_generator import ExcelGenerator
-from ai_assistant import get_ai_assistant
-from academic_references import get_reference_manager
+
+# The generator and API-client modules pull in heavy dependencies
+# (lxml, openpyxl, the Gemini SDK) - they are imported inside the steps
+# that use them so partial runs don't pay their startup cost
 
 
 def main():
@@ -29,13 +30,17 @@ def main():
     parser.add_argument('--verbose', action='store_true', help='Show detailed progress')
     
     args = parser.parse_args()
-    
+
+    # The project dates are fixed inputs - format them once up front
+    start_s = PROJECT_START.strftime('%Y-%m-%d')
+    deadline_s = PROJECT_DEADLINE.strftime('%Y-%m-%d')
+
     print("="*70)
     print("PRODEGEIT PROJECT MANAGEMENT SOLUTION")
     print("AI-Enhanced Project Planning System")
     print("="*70)
     print(f"\nProject: Equipment Acquisition and Installation")
-    print(f"Period: {PROJECT_START.strftime('%Y-%m-%d')} to {PROJECT_DEADLINE.strftime('%Y-%m-%d')}")
+    print(f"Period: {start_s} to {deadline_s}")
     print(f"Budget: €{BUDGET_MAX:,} (€{BUDGET_WITH_RESERVE:,} with reserve)")
     print(f"\nActivities: {len(ACTIVITIES)}")
     print(f"Resources: {len(RESOURCES)}")
@@ -56,8 +61,9 @@ def main():
         print("STEP 1: RESOURCE ALLOCATION")
         print("="*70)
         
-        allocator, allocation_results = run_allocation()
-        
+        allocator, allocation_results = run_allocation(verbose=args.verbose)
+        completion_s = allocation_results['completion_date'].strftime('%Y-%m-%d')
+
         # Check budget compliance
         if allocation_results['estimated_cost'] <= BUDGET_WITH_RESERVE:
             print(f"\n✓ Budget: COMPLIANT (€{allocation_results['estimated_cost']:,.2f} / €{BUDGET_WITH_RESERVE:,})")
@@ -82,126 +88,161 @@ def main():
         print("STEP 2: RISK ANALYSIS")
         print("="*70)
         
-        risk_analyzer, risk_results = run_risk_analysis()
-        
+        risk_analyzer, risk_results = run_risk_analysis(verbose=args.verbose)
+
+        # Bound once - later steps reuse these instead of re-running the
+        # optimal_strategy lookup-and-branch at every site
+        mitigation_cost = (risk_results['optimal_strategy']['total_cost']
+                           if risk_results['optimal_strategy'] else 0)
+        total_project_cost = allocation_results['estimated_cost'] + mitigation_cost
+
         # Update costs with risk mitigation
         if risk_results['optimal_strategy']:
-            total_with_risk = (allocation_results['estimated_cost'] + 
-                              risk_results['optimal_strategy']['total_cost'])
-            print(f"\nTotal Cost with Risk Mitigation: €{total_with_risk:,.2f}")
-            
-            if total_with_risk <= BUDGET_WITH_RESERVE:
-                print(f"✓ Still within budget (€{BUDGET_WITH_RESERVE - total_with_risk:,.2f} remaining)")
+            print(f"\nTotal Cost with Risk Mitigation: €{total_project_cost:,.2f}")
+
+            if total_project_cost <= BUDGET_WITH_RESERVE:
+                print(f"✓ Still within budget (€{BUDGET_WITH_RESERVE - total_project_cost:,.2f} remaining)")
             else:
-                print(f"✗ Exceeds budget by €{total_with_risk - BUDGET_WITH_RESERVE:,.2f}")
+                print(f"✗ Exceeds budget by €{total_project_cost - BUDGET_WITH_RESERVE:,.2f}")
     
-    # STEP 3: Generate MS Project XML
-    if not args.report_only:
-        print("\n" + "="*70)
-        print("STEP 3: MS PROJECT XML GENERATION")
-        print("="*70)
-        
-        xml_path = os.path.join(output_dir, "ProDegeit_Project.xml")
-        generate_ms_project_xml(
-            allocation_results['schedule'],
-            {k: v for k, v in allocation_results['allocation_map'].items()},
-            RESOURCES,
-            xml_path
-        )
-    
-    # STEP 4: Generate Excel Reports
-    if not args.report_only:
-        print("\n" + "="*70)
-        print("STEP 4: EXCEL REPORTS GENERATION")
-        print("="*70)
-        
-        excel_gen = ExcelGenerator()
-        
-        # Resource workbook
-        resource_path = os.path.join(output_dir, "ProDegeit_Resources.xlsx")
-        excel_gen.generate_resource_workbook(resource_path)
-        
-        # Allocation workbook
-        allocation_path = os.path.join(output_dir, "ProDegeit_Allocation.xlsx")
-        excel_gen.generate_allocation_workbook(allocation_results, allocation_path)
-    
-    # STEP 5: Gather Academic References
+    # STEPS 3-5: XML, Excel and Scopus outputs are independent I/O-bound
+    # tasks - run them on a thread pool so the wall time is the slowest
+    # step instead of the sum of all of them
     print("\n" + "="*70)
-    print("STEP 5: ACADEMIC REFERENCES")
+    print("STEPS 3-5: XML / EXCEL / ACADEMIC REFERENCES")
     print("="*70)
-    
-    ref_manager = get_reference_manager()
-    if ref_manager.available:
-        print("Gathering academic references from Scopus...")
-        try:
-            references = ref_manager.gather_all_references(max_per_topic=3)
-            print(f"✓ Found {len(references)} relevant articles")
-        except Exception as e:
-            print(f"! Using fallback references: {e}")
-            references = []
-    else:
-        print("Using fallback academic references")
-        references = []
+
+    ref_manager = None
+    references = []
+    if not args.xml_only:
+        from academic_references import get_reference_manager
+        ref_manager = get_reference_manager()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {}
+
+        if not args.report_only:
+            from excel_generator import ExcelGenerator
+            from ms_project_generator import generate_ms_project_xml
+
+            # MS Project XML
+            xml_path = os.path.join(output_dir, "ProDegeit_Project.xml")
+            futures['MS Project XML'] = executor.submit(
+                generate_ms_project_xml,
+                allocation_results['schedule'],
+                {k: v for k, v in allocation_results['allocation_map'].items()},
+                RESOURCES,
+                xml_path
+            )
+
+            excel_gen = ExcelGenerator()
+
+            # Resource workbook
+            resource_path = os.path.join(output_dir, "ProDegeit_Resources.xlsx")
+            futures['Resource workbook'] = executor.submit(
+                excel_gen.generate_resource_workbook, resource_path)
+
+            # Allocation workbook
+            allocation_path = os.path.join(output_dir, "ProDegeit_Allocation.xlsx")
+            futures['Allocation workbook'] = executor.submit(
+                excel_gen.generate_allocation_workbook, allocation_results, allocation_path)
+
+        if ref_manager is None:
+            print("Skipping academic references (--xml-only)")
+        elif ref_manager.available:
+            print("Gathering academic references from Scopus...")
+            futures['References'] = executor.submit(
+                ref_manager.gather_all_references, 3)
+        else:
+            print("Using fallback academic references")
+
+        for name, future in futures.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"! {name} failed: {e}")
+            else:
+                if name == 'References':
+                    references = result
+                    print(f"✓ Found {len(references)} relevant articles")
     
     # STEP 6: Generate AI-Enhanced Content
     print("\n" + "="*70)
     print("STEP 6: AI CONTENT GENERATION")
     print("="*70)
     
-    ai_assistant = get_ai_assistant()
-    
-    if ai_assistant.available:
+    ai_assistant = None
+    if not args.xml_only:
+        from ai_assistant import get_ai_assistant
+        ai_assistant = get_ai_assistant()
+
+    if ai_assistant is not None and ai_assistant.available:
         print("Generating AI-enhanced content...")
-        
-        # Executive summary
-        exec_summary = ai_assistant.generate_executive_summary(
-            {
-                'start_date': PROJECT_START.strftime('%Y-%m-%d'),
-                'deadline': PROJECT_DEADLINE.strftime('%Y-%m-%d'),
-                'budget_max': BUDGET_MAX,
-                'budget_with_reserve': BUDGET_WITH_RESERVE,
-            },
-            {
-                'total_activities': len(ACTIVITIES),
-                'total_resources': allocation_results['total_resources'],
-                'estimated_cost': allocation_results['estimated_cost'],
-                'completion_date': allocation_results['completion_date'].strftime('%Y-%m-%d'),
-                'budget_status': budget_status,
-                'timeline_status': timeline_status,
-            },
-            {
-                'total_risks': len(RISKS),
-                'total_expected_cost': risk_results['expected_case']['total_expected_cost'],
-                'mitigation_cost': risk_results['optimal_strategy']['total_cost'] if risk_results['optimal_strategy'] else 0,
-                'expected_cost_after': risk_results['residual_risk']['expected_cost'],
-            }
-        )
-        
-        print("✓ Executive summary generated")
-        
-        # Conclusions
-        conclusions = ai_assistant.generate_conclusions(
-            {
-                'allocated': allocation_results['estimated_cost'] + (risk_results['optimal_strategy']['total_cost'] if risk_results.get('optimal_strategy') else 0),
-                'limit': BUDGET_WITH_RESERVE,
-                'remaining': BUDGET_WITH_RESERVE - allocation_results['estimated_cost'],
-                'status': budget_status,
-            },
-            {
-                'projected_completion': allocation_results['completion_date'].strftime('%Y-%m-%d'),
-                'deadline': PROJECT_DEADLINE.strftime('%Y-%m-%d'),
-                'buffer_days': (PROJECT_DEADLINE - allocation_results['completion_date']).days,
-                'status': timeline_status,
-            },
-            [
-                "Monitor critical path activities closely",
-                "Implement selected risk mitigations immediately",
-                "Conduct weekly resource utilization reviews",
-                "Maintain communication with core team during vacation periods"
-            ]
-        )
-        
-        print("✓ Conclusions generated")
+
+        # The two LLM calls are independent network round-trips: the
+        # conclusions run on a worker thread while the executive summary
+        # streams to the console as its tokens arrive
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            summary_stream = ai_assistant.generate_executive_summary_stream(
+                {
+                    'start_date': start_s,
+                    'deadline': deadline_s,
+                    'budget_max': BUDGET_MAX,
+                    'budget_with_reserve': BUDGET_WITH_RESERVE,
+                },
+                {
+                    'total_activities': len(ACTIVITIES),
+                    'total_resources': allocation_results['total_resources'],
+                    'estimated_cost': allocation_results['estimated_cost'],
+                    'completion_date': completion_s,
+                    'budget_status': budget_status,
+                    'timeline_status': timeline_status,
+                },
+                {
+                    'total_risks': len(RISKS),
+                    'total_expected_cost': risk_results['expected_case']['total_expected_cost'],
+                    'mitigation_cost': mitigation_cost,
+                    'expected_cost_after': risk_results['residual_risk']['expected_cost'],
+                }
+            )
+
+            conclusions_future = executor.submit(
+                ai_assistant.generate_conclusions,
+                {
+                    'allocated': total_project_cost,
+                    'limit': BUDGET_WITH_RESERVE,
+                    'remaining': BUDGET_WITH_RESERVE - allocation_results['estimated_cost'],
+                    'status': budget_status,
+                },
+                {
+                    'projected_completion': completion_s,
+                    'deadline': deadline_s,
+                    'buffer_days': (PROJECT_DEADLINE - allocation_results['completion_date']).days,
+                    'status': timeline_status,
+                },
+                [
+                    "Monitor critical path activities closely",
+                    "Implement selected risk mitigations immediately",
+                    "Conduct weekly resource utilization reviews",
+                    "Maintain communication with core team during vacation periods"
+                ]
+            )
+
+            # Show the summary as it streams instead of blocking until
+            # the full response has arrived
+            summary_chunks = []
+            for chunk in summary_stream:
+                summary_chunks.append(chunk)
+                print(chunk, end='', flush=True)
+            exec_summary = ''.join(summary_chunks)
+            print("\n✓ Executive summary generated")
+
+            conclusions = conclusions_future.result()
+            print("✓ Conclusions generated")
+    elif ai_assistant is None:
+        print("Skipping AI content generation (--xml-only)")
+        exec_summary = ""
+        conclusions = ""
     else:
         print("! AI assistant not available - using fallback content")
         exec_summary = "AI content generation unavailable. Please review generated data files."
@@ -212,11 +253,20 @@ def main():
     print("STEP 7: PDF REPORT GENERATION")
     print("="*70)
     
+    # One getcwd round-trip instead of one per deliverable line
+    if args.report_only:
+        xml_abs = resource_abs = allocation_abs = 'Skipped'
+    else:
+        output_abs = os.path.abspath(output_dir)
+        xml_abs = os.path.join(output_abs, os.path.basename(xml_path))
+        resource_abs = os.path.join(output_abs, os.path.basename(resource_path))
+        allocation_abs = os.path.join(output_abs, os.path.basename(allocation_path))
+
     print("Note: Full PDF report generation requires additional implementation.")
     print("Current deliverables ready:")
-    print(f"  - MS Project XML: {os.path.abspath(xml_path) if not args.report_only else 'Skipped'}")
-    print(f"  - Resource Excel: {os.path.abspath(resource_path) if not args.report_only else 'Skipped'}")
-    print(f"  - Allocation Excel: {os.path.abspath(allocation_path) if not args.report_only else 'Skipped'}")
+    print(f"  - MS Project XML: {xml_abs}")
+    print(f"  - Resource Excel: {resource_abs}")
+    print(f"  - Allocation Excel: {allocation_abs}")
     
     # FINAL SUMMARY
     print("\n" + "="*70)
@@ -231,15 +281,14 @@ def main():
     print(f"\n💰 Financial Summary:")
     print(f"  Activity Costs: €{allocation_results['estimated_cost'] - allocation_results['core_team_cost']:,.2f}")
     print(f"  Core Team Costs: €{allocation_results['core_team_cost']:,.2f}")
-    print(f"  Risk Mitigation: €{risk_results['optimal_strategy']['total_cost'] if risk_results.get('optimal_strategy') else 0:,.2f}")
-    total_project_cost = allocation_results['estimated_cost'] + (risk_results['optimal_strategy']['total_cost'] if risk_results.get('optimal_strategy') else 0)
+    print(f"  Risk Mitigation: €{mitigation_cost:,.2f}")
     print(f"  TOTAL: €{total_project_cost:,.2f}")
     print(f"  Budget Status: {budget_status.upper()}")
     
     print(f"\n📅 Schedule Summary:")
-    print(f"  Start Date: {PROJECT_START.strftime('%Y-%m-%d')}")
-    print(f"  Projected End: {allocation_results['completion_date'].strftime('%Y-%m-%d')}")
-    print(f"  Deadline: {PROJECT_DEADLINE.strftime('%Y-%m-%d')}")
+    print(f"  Start Date: {start_s}")
+    print(f"  Projected End: {completion_s}")
+    print(f"  Deadline: {deadline_s}")
     print(f"  Status: {timeline_status.upper()}")
     
     print(f"\n⚠️  Risk Summary:")
@@ -249,7 +298,7 @@ def main():
     print(f"  Risk Reduction: {((1 - risk_results['residual_risk']['expected_cost'] / risk_results['expected_case']['total_expected_cost']) * 100):.1f}%")
     
     # API Usage Statistics
-    if ai_assistant.available:
+    if ai_assistant is not None and ai_assistant.available:
         usage_stats = ai_assistant.get_usage_stats()
         print(f"\n🤖 AI API Usage:")
         print(f"  Model: {usage_stats['model']}")
@@ -263,37 +312,49 @@ def main():
     print("✓ PROJECT PLANNING COMPLETE")
     print("="*70)
     
-    # Save summary to text file
+    # Save summary to text file - assemble the lines first and issue a
+    # single write instead of ~25 small ones
     summary_path = os.path.join(output_dir, "ProDegeit_Summary.txt")
+    parts = [
+        "PRODEGEIT PROJECT SUMMARY\n",
+        "="*70 + "\n\n",
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        f"Total Cost: €{total_project_cost:,.2f}\n",
+        f"Budget: €{BUDGET_WITH_RESERVE:,}\n",
+        f"Status: {budget_status}\n\n",
+        f"Completion: {completion_s}\n",
+        f"Deadline: {deadline_s}\n",
+        f"Timeline: {timeline_status}\n\n",
+    ]
+
+    # AI sections are omitted when nothing was generated (--xml-only)
+    if exec_summary or conclusions:
+        parts += [
+            "EXECUTIVE SUMMARY\n",
+            "-"*70 + "\n",
+            exec_summary + "\n\n",
+            "CONCLUSIONS\n",
+            "-"*70 + "\n",
+            conclusions + "\n",
+        ]
+
+    # Add API usage stats
+    if ai_assistant is not None and ai_assistant.available:
+        usage_stats = ai_assistant.get_usage_stats()
+        parts += [
+            "\n" + "="*70 + "\n",
+            "AI API USAGE STATISTICS\n",
+            "="*70 + "\n",
+            f"Model: {usage_stats['model']}\n",
+            f"Total Tokens: {usage_stats['total_tokens']:,}\n",
+            f"  - Input Tokens: {usage_stats['input_tokens']:,}\n",
+            f"  - Output Tokens: {usage_stats['output_tokens']:,}\n",
+            f"Estimated Cost: ${usage_stats['estimated_cost_usd']:.4f} USD\n",
+            f"Pricing: ${usage_stats['pricing']['input']:.2f}/${usage_stats['pricing']['output']:.2f} per 1M tokens\n",
+        ]
+
     with open(summary_path, 'w', encoding='utf-8') as f:
-        f.write("PRODEGEIT PROJECT SUMMARY\n")
-        f.write("="*70 + "\n\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        f.write(f"Total Cost: €{total_project_cost:,.2f}\n")
-        f.write(f"Budget: €{BUDGET_WITH_RESERVE:,}\n")
-        f.write(f"Status: {budget_status}\n\n")
-        f.write(f"Completion: {allocation_results['completion_date'].strftime('%Y-%m-%d')}\n")
-        f.write(f"Deadline: {PROJECT_DEADLINE.strftime('%Y-%m-%d')}\n")
-        f.write(f"Timeline: {timeline_status}\n\n")
-        f.write("EXECUTIVE SUMMARY\n")
-        f.write("-"*70 + "\n")
-        f.write(exec_summary + "\n\n")
-        f.write("CONCLUSIONS\n")
-        f.write("-"*70 + "\n")
-        f.write(conclusions + "\n")
-        
-        # Add API usage stats
-        if ai_assistant.available:
-            usage_stats = ai_assistant.get_usage_stats()
-            f.write("\n" + "="*70 + "\n")
-            f.write("AI API USAGE STATISTICS\n")
-            f.write("="*70 + "\n")
-            f.write(f"Model: {usage_stats['model']}\n")
-            f.write(f"Total Tokens: {usage_stats['total_tokens']:,}\n")
-            f.write(f"  - Input Tokens: {usage_stats['input_tokens']:,}\n")
-            f.write(f"  - Output Tokens: {usage_stats['output_tokens']:,}\n")
-            f.write(f"Estimated Cost: ${usage_stats['estimated_cost_usd']:.4f} USD\n")
-            f.write(f"Pricing: ${usage_stats['pricing']['input']:.2f}/${usage_stats['pricing']['output']:.2f} per 1M tokens\n")
+        f.write(''.join(parts))
     
     print(f"\nSummary saved to: {os.path.abspath(summary_path)}")
     
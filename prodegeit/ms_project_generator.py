@@ -3,10 +3,20 @@ ProDegeit Project - MS Project XML Generator
 Generates MS Project-compatible XML file
 """
 
+import functools
+import gzip
+
 from datetime import datetime, timedelta
 from typing import Dict, List
 from lxml import etree
-from data_models import PROJECT_START, ACTIVITIES, RESOURCES
+from lxml.builder import E
+from data_models import PROJECT_START, ACTIVITIES, ACTIVITY_SOA, RESOURCES
+
+
+@functools.lru_cache(maxsize=None)
+def _duration_text(duration_days: int) -> str:
+    """MS Project duration string for a day count (8 working hours/day)"""
+    return f"PT{duration_days * 8}H0M0S"
 
 
 class MSProjectXMLGenerator:
@@ -24,197 +34,207 @@ class MSProjectXMLGenerator:
         self.schedule = schedule
         self.allocation_map = allocation_map
         self.resources = resource_list
+        # Resource UIDs are 1-based list positions; index them once by name
+        self._name_to_uid = {res.name: i for i, res in enumerate(resource_list, start=1)}
         
-    def generate_xml(self, output_path: str):
+    def generate_xml(self, output_path: str, compress: bool = False):
         """
         Generate complete MS Project XML file
-        
+
+        Streams compact (unindented) elements to disk with lxml's
+        incremental writer instead of building the whole tree in memory
+        and serializing it afterwards.
+
         Args:
             output_path: Path to save XML file
+            compress: Gzip the output (pass an .xml.gz output_path)
         """
         print(f"\nGenerating MS Project XML: {output_path}")
-        
-        # Create root element
-        root = etree.Element("Project", xmlns="http://schemas.microsoft.com/project")
-        
-        # Add project properties
-        self._add_project_properties(root)
-        
-        # Add calendars
-        self._add_calendars(root)
-        
-        # Add tasks
-        self._add_tasks(root)
-        
-        # Add resources
-        self._add_resources(root)
-        
-        # Add assignments
-        self._add_assignments(root)
-        
-        # Write to file
-        tree = etree.ElementTree(root)
-        tree.write(output_path, pretty_print=True, xml_declaration=True, encoding='UTF-8')
-        
+
+        opener = gzip.open if compress else open
+        with opener(output_path, 'wb') as sink, \
+                etree.xmlfile(sink, encoding='UTF-8') as xf:
+            xf.write_declaration()
+            with xf.element("Project", xmlns="http://schemas.microsoft.com/project"):
+                # Add project properties
+                self._add_project_properties(xf)
+
+                # Add calendars
+                self._add_calendars(xf)
+
+                # Add tasks
+                self._add_tasks(xf)
+
+                # Add resources
+                self._add_resources(xf)
+
+                # Add assignments
+                self._add_assignments(xf)
+
         print(f"✓ MS Project XML generated successfully")
+
+    @staticmethod
+    def _write_text(xf, tag: str, text: str):
+        """Write a single <tag>text</tag> element to the stream"""
+        xf.write(E(tag, text))
     
-    def _add_project_properties(self, root):
+    def _add_project_properties(self, xf):
         """Add project-level properties"""
-        etree.SubElement(root, "SaveVersion").text = "14"
-        etree.SubElement(root, "Name").text = "ProDegeit Equipment Installation"
-        etree.SubElement(root, "Title").text = "ProDegeit Project Plan"
-        etree.SubElement(root, "Author").text = "ProDegeit Team"
-        etree.SubElement(root, "Company").text = "ProDegeit International"
-        etree.SubElement(root, "StartDate").text = PROJECT_START.strftime("%Y-%m-%dT08:00:00")
-        etree.SubElement(root, "ScheduleFromStart").text = "1"
-        etree.SubElement(root, "CurrentDate").text = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-        etree.SubElement(root, "CalendarUID").text = "1"
-        etree.SubElement(root, "DefaultStartTime").text = "08:00:00"
-        etree.SubElement(root, "DefaultFinishTime").text = "17:00:00"
-        etree.SubElement(root, "HoursPerDay").text = "8.0"
-        etree.SubElement(root, "HoursPerWeek").text = "40.0"
-        etree.SubElement(root, "DaysPerMonth").text= "20"
-        etree.SubElement(root, "CurrencySymbol").text = "€"
+        for tag, text in (
+            ("SaveVersion", "14"),
+            ("Name", "ProDegeit Equipment Installation"),
+            ("Title", "ProDegeit Project Plan"),
+            ("Author", "ProDegeit Team"),
+            ("Company", "ProDegeit International"),
+            ("StartDate", PROJECT_START.strftime("%Y-%m-%dT08:00:00")),
+            ("ScheduleFromStart", "1"),
+            ("CurrentDate", datetime.now().strftime("%Y-%m-%dT%H:%M:%S")),
+            ("CalendarUID", "1"),
+            ("DefaultStartTime", "08:00:00"),
+            ("DefaultFinishTime", "17:00:00"),
+            ("HoursPerDay", "8.0"),
+            ("HoursPerWeek", "40.0"),
+            ("DaysPerMonth", "20"),
+            ("CurrencySymbol", "€"),
+        ):
+            self._write_text(xf, tag, text)
     
-    def _add_calendars(self, root):
+    def _add_calendars(self, xf):
         """Add project calendars"""
-        calendars = etree.SubElement(root, "Calendars")
-        
         # Standard calendar (Mon-Fri, 8h/day)
-        calendar = etree.SubElement(calendars, "Calendar")
-        etree.SubElement(calendar, "UID").text = "1"
-        etree.SubElement(calendar, "Name").text = "Standard"
-        etree.SubElement(calendar, "IsBaseCalendar").text = "1"
-        
-        # Define weekdays
-        weekdays = etree.SubElement(calendar, "WeekDays")
-        
-        # Sunday (non-working)
-        sunday = etree.SubElement(weekdays, "WeekDay")
-        etree.SubElement(sunday, "DayType").text = "1"
-        etree.SubElement(sunday, "DayWorking").text = "0"
-        
-        # Monday-Friday (working days)
-        for day in range(2, 7):  # 2=Monday, 6=Friday
-            weekday = etree.SubElement(weekdays, "WeekDay")
-            etree.SubElement(weekday, "DayType").text = str(day)
-            etree.SubElement(weekday, "DayWorking").text = "1"
-            
-            working_times = etree.SubElement(weekday, "WorkingTimes")
-            working_time = etree.SubElement(working_times, "WorkingTime")
-            etree.SubElement(working_time, "FromTime").text = "08:00:00"
-            etree.SubElement(working_time, "ToTime").text = "17:00:00"
-        
-        # Saturday (non-working)
-        saturday = etree.SubElement(weekdays, "WeekDay")
-        etree.SubElement(saturday, "DayType").text = "7"
-        etree.SubElement(saturday, "DayWorking").text = "0"
-    
-    def _add_tasks(self, root):
-        """Add all project tasks"""
-        tasks = etree.SubElement(root, "Tasks")
-        
-        for activity in ACTIVITIES:
-            task = etree.SubElement(tasks, "Task")
-            
-            schedule_info = self.schedule.get(activity.id, {})
-            start_date = schedule_info.get('start')
-            end_date = schedule_info.get('end')
-            
-            etree.SubElement(task, "UID").text = str(activity.id)
-            etree.SubElement(task, "ID").text = str(activity.id)
-            etree.SubElement(task, "Name").text = activity.name
-            etree.SubElement(task, "Type").text = "1"  # Fixed duration
-            etree.SubElement(task, "IsNull").text = "0"
-            
-             # Convert days to hours (8 hours per day)
-            duration_hours = activity.duration_days * 8
-            etree.SubElement(task, "Duration").text = f"PT{duration_hours}H0M0S"
-            
-            if start_date:
-                etree.SubElement(task, "Start").text = start_date.strftime("%Y-%m-%dT08:00:00")
-            if end_date:
-                etree.SubElement(task, "Finish").text = end_date.strftime("%Y-%m-%dT17:00:00")
-            
-            # Add predecessors
-            if activity.predecessors:
-                predecessor_links = etree.SubElement(task, "PredecessorLink")
-                for pred_id in activity.predecessors:
-                    pred_link = etree.SubElement(predecessor_links, "PredecessorLink")
-                    etree.SubElement(pred_link, "PredecessorUID").text = str(pred_id)
-                    etree.SubElement(pred_link, "Type").text = "1"  # Finish-to-Start
-            
-            etree.SubElement(task, "PercentComplete").text = "0"
-            etree.SubElement(task, "ConstraintType").text = "0"  # As Soon As Possible
-    
-    def _add_resources(self, root):
+        calendars = E.Calendars(
+            E.Calendar(
+                E.UID("1"),
+                E.Name("Standard"),
+                E.IsBaseCalendar("1"),
+                E.WeekDays(
+                    # Sunday (non-working)
+                    E.WeekDay(E.DayType("1"), E.DayWorking("0")),
+                    # Monday-Friday (working days)
+                    *[E.WeekDay(
+                        E.DayType(str(day)),
+                        E.DayWorking("1"),
+                        E.WorkingTimes(
+                            E.WorkingTime(E.FromTime("08:00:00"),
+                                          E.ToTime("17:00:00"))))
+                      for day in range(2, 7)],  # 2=Monday, 6=Friday
+                    # Saturday (non-working)
+                    E.WeekDay(E.DayType("7"), E.DayWorking("0")),
+                ),
+            )
+        )
+
+        xf.write(calendars)
+
+    def _add_tasks(self, xf):
+        """Add all project tasks, one streamed <Task> at a time"""
+        soa = ACTIVITY_SOA
+        with xf.element("Tasks"):
+            # Iterate the structure-of-arrays mirror: plain zip over
+            # parallel arrays, no per-task attribute lookups
+            for activity_id, name, duration, predecessors in zip(
+                    soa['id'], soa['name'], soa['duration_days'],
+                    soa['predecessors']):
+                xf.write(self._build_task(int(activity_id), name,
+                                          int(duration), predecessors))
+
+    def _build_task(self, activity_id, name, duration_days, predecessors):
+        """Build a <Task> element for one activity"""
+        schedule_info = self.schedule.get(activity_id, {})
+        start_date = schedule_info.get('start')
+        end_date = schedule_info.get('end')
+
+        uid = str(activity_id)
+        task = E.Task(
+            E.UID(uid),
+            E.ID(uid),
+            E.Name(name),
+            E.Type("1"),  # Fixed duration
+            E.IsNull("0"),
+            E.Duration(_duration_text(duration_days)),
+        )
+
+        # Only the date part varies; concatenating the fixed time-of-day is
+        # cheaper than formatting it through strftime every task
+        if start_date:
+            task.append(E.Start(start_date.strftime("%Y-%m-%d") + "T08:00:00"))
+        if end_date:
+            task.append(E.Finish(end_date.strftime("%Y-%m-%d") + "T17:00:00"))
+
+        # Add predecessors: one PredecessorLink per predecessor, directly
+        # under the Task as the MS Project schema expects
+        task.extend(E.PredecessorLink(E.PredecessorUID(str(pred_id)),
+                                      E.Type("1"))  # Finish-to-Start
+                    for pred_id in predecessors)
+
+        task.append(E.PercentComplete("0"))
+        task.append(E.ConstraintType("0"))  # As Soon As Possible
+        return task
+
+    def _add_resources(self, xf):
         """Add all project resources"""
-        resources_elem = etree.SubElement(root, "Resources")
-        
-        for i, resource in enumerate(self.resources, start=1):
-            resource_elem = etree.SubElement(resources_elem, "Resource")
-            
-            etree.SubElement(resource_elem, "UID").text = str(i)
-            etree.SubElement(resource_elem, "ID").text = str(i)
-            etree.SubElement(resource_elem, "Name").text = resource.name
-            etree.SubElement(resource_elem, "Type").text = "1"  # Work resource
-            etree.SubElement(resource_elem, "IsNull").text = "0"
-            
-            # Standard rate (cost per hour)
-            etree.SubElement(resource_elem, "StandardRate").text = str(resource.cost_per_hour * 8)  # Daily rate
-            etree.SubElement(resource_elem, "OvertimeRate").text = str(resource.cost_per_hour * 1.5 * 8)
-            
+        with xf.element("Resources"):
+            for i, resource in enumerate(self.resources, start=1):
+                xf.write(self._build_resource(i, resource))
+
+    def _build_resource(self, i, resource):
+        """Build a <Resource> element"""
+        return E.Resource(
+            E.UID(str(i)),
+            E.ID(str(i)),
+            E.Name(resource.name),
+            E.Type("1"),  # Work resource
+            E.IsNull("0"),
+            # Standard rate (cost per hour, as a daily rate)
+            E.StandardRate(str(resource.cost_per_hour * 8)),
+            E.OvertimeRate(str(resource.cost_per_hour * 1.5 * 8)),
             # Max units (availability percentage)
-            max_units = int(resource.availability_pct * 100)
-            etree.SubElement(resource_elem, "MaxUnits").text = f"{max_units}%"
-    
-    def _add_assignments(self, root):
+            E.MaxUnits(f"{int(resource.availability_pct * 100)}%"),
+        )
+
+    def _add_assignments(self, xf):
         """Add resource assignments to tasks"""
-        assignments = etree.SubElement(root, "Assignments")
-        
         assignment_uid = 1
-        
-        for activity_id, resource_names in self.allocation_map.items():
-            if not resource_names:
-                continue
-            
-            # Calculate units per resource (split evenly if multiple resources)
-            units_per_resource = 100 // len(resource_names) if resource_names else 0
-            
-            for resource_name in resource_names:
-                # Find resource UID
-                resource_uid = None
-                for i, res in enumerate(self.resources, start=1):
-                    if res.name == resource_name:
-                        resource_uid = i
-                        break
-                
-                if not resource_uid:
+
+        with xf.element("Assignments"):
+            for activity_id, resource_names in self.allocation_map.items():
+                if not resource_names:
                     continue
-                
-                assignment = etree.SubElement(assignments, "Assignment")
-                
-                etree.SubElement(assignment, "UID").text = str(assignment_uid)
-                etree.SubElement(assignment, "TaskUID").text = str(activity_id)
-                etree.SubElement(assignment, "ResourceUID").text = str(resource_uid)
-                etree.SubElement(assignment, "Units").text = f"{units_per_resource}%"
-                
-                assignment_uid += 1
-
-
-def generate_ms_project_xml(schedule: Dict, allocation_map: Dict, 
-                           resource_list: List, output_path: str):
+
+                # Calculate units per resource (split evenly if multiple resources)
+                units_per_resource = 100 // len(resource_names) if resource_names else 0
+
+                for resource_name in resource_names:
+                    # Find resource UID
+                    resource_uid = self._name_to_uid.get(resource_name)
+                    if not resource_uid:
+                        continue
+
+                    xf.write(E.Assignment(
+                        E.UID(str(assignment_uid)),
+                        E.TaskUID(str(activity_id)),
+                        E.ResourceUID(str(resource_uid)),
+                        E.Units(f"{units_per_resource}%"),
+                    ))
+
+                    assignment_uid += 1
+
+
+def generate_ms_project_xml(schedule: Dict, allocation_map: Dict,
+                           resource_list: List, output_path: str,
+                           compress: bool = False):
     """
     Generate MS Project XML file
-    
+
     Args:
         schedule: Activity schedule
         allocation_map: Resource allocations
         resource_list: List of resources
         output_path: Output file path
+        compress: Gzip the output (pass an .xml.gz output_path)
     """
     generator = MSProjectXMLGenerator(schedule, allocation_map, resource_list)
-    generator.generate_xml(output_path)
+    generator.generate_xml(output_path, compress=compress)
 
 
 if __name__ == "__main__":
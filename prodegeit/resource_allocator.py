@@ -4,113 +4,237 @@ Implements intelligent resource allocation algorithm with skill-based matching
 """ 
 
 from typing import List, Dict, Tuple, Optional
+from collections import deque
 from datetime import datetime, timedelta
-import copy
+from operator import attrgetter
+import functools
+
+import numpy as np
 
 from data_models import (
-    Activity, Resource, ACTIVITIES, RESOURCES, PROJECT_START,
-    HOURS_PER_DAY, calculate_project_weeks, get_activity_by_id
+    Activity, Resource, ACTIVITIES, RESOURCES, PROJECT_START, PROJECT_START_D,
+    HORIZON_DAYS, HOURS_PER_DAY, MATCH_INFEASIBLE, calculate_project_weeks,
+    get_activity_by_id, to_day_index, from_day_index
 )
 
+# Optional: SciPy's Hungarian solver enables globally optimal matching.
+# Without it the greedy per-activity allocation below is used.
+try:
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    linear_sum_assignment = None
+    SCIPY_AVAILABLE = False
+
+# Cost-matrix weighting: one skill-surplus point outweighs any plausible
+# hourly-rate difference, mirroring the greedy sort order (surplus first,
+# cost as tie-break)
+_SURPLUS_WEIGHT = 1000
+_INFEASIBLE_COST = 1e18
+
+
+# Every day offset in the fixed project horizon, as datetime64[D]
+_HORIZON_STARTS = PROJECT_START_D + np.arange(HORIZON_DAYS)
+
+
+@functools.lru_cache(maxsize=None)
+def _bday_end_offsets(working_days: int) -> np.ndarray:
+    """
+    Lookup row: end-day offset after working_days business days
+
+    One vectorized busday_offset over the whole horizon per distinct
+    duration, amortizing the business-day math into table lookups for
+    every schedule rebuild that follows.
+    """
+    ends = np.busday_offset(_HORIZON_STARTS, working_days, roll='forward')
+    return (ends - PROJECT_START_D).astype(np.int64)
+
+
+def _add_working_days(start_date: datetime, working_days: int) -> datetime:
+    """
+    Add working days to a date (Monday-Friday only)
+
+    A single table lookup for dates inside the project horizon; the
+    direct busday_offset call remains as a fallback for dates past it.
+
+    Args:
+        start_date: Starting date
+        working_days: Number of working days to add
+
+    Returns:
+        End date after adding working days
+    """
+    day_idx = (start_date - PROJECT_START).days
+    if 0 <= day_idx < HORIZON_DAYS:
+        end_offset = int(_bday_end_offsets(working_days)[day_idx])
+        return PROJECT_START + timedelta(days=end_offset)
+    end = np.busday_offset(np.datetime64(start_date.date(), 'D'),
+                           working_days, roll='forward')
+    return datetime.combine(end.astype(object), start_date.time())
+
+
+def _end_offset(start_day: int, working_days: int) -> int:
+    """Day offset reached after working_days business days from start_day"""
+    if 0 <= start_day < HORIZON_DAYS:
+        return int(_bday_end_offsets(working_days)[start_day])
+    return to_day_index(_add_working_days(from_day_index(start_day), working_days))
+
 
 class ResourceAllocator:
     """Manages resource allocation to project activities"""
     
-    def __init__(self, activities: List[Activity], resources: List[Resource]):
+    def __init__(self, activities: List[Activity], resources: List[Resource],
+                 verbose: bool = False):
         """
         Initialize the resource allocator
-        
+
         Args:
             activities: List of project activities
             resources: List of available resources
+            verbose: Print per-activity allocation progress
         """
-        self.activities = copy.deepcopy(activities)
-        self.resources = copy.deepcopy(resources)
-        self.allocation_map = {}  # {activity_id: [resource_names]}
-        self.schedule = {}  # {activity_id: {'start': date, 'end': date}}
-        
+        self.verbose = verbose
+        # Explicit clones keep the caller's objects pristine without the
+        # cost of copy.deepcopy's reflective walk
+        self.activities = [activity.clone() for activity in activities]
+        self.resources = [resource.clone() for resource in resources]
+        self.schedule = {}  # materialized {activity_id: {...}} view (see schedule_dict)
+        self._activity_week = {}  # {activity_id: 1-based start week}
+        self.project_end = PROJECT_START  # latest activity end date
+
+        # Structure-of-arrays schedule state, indexed by activity list
+        # position: int32 day offsets from PROJECT_START plus per-activity
+        # lists of allocated resource indices. Dict views for downstream
+        # consumers are materialized at the results boundary.
+        n = len(self.activities)
+        self._dur = np.array([a.duration_days for a in self.activities], np.int32)
+        self._start_day = np.full(n, -1, np.int32)
+        self._end_day = np.full(n, -1, np.int32)
+        self._alloc_indices = [[] for _ in range(n)]
+        self._topo_idx = []  # activity indices in topological order
+
+        # Index-based dependency adjacency, built once: every schedule
+        # rebuild walks these lists instead of rescanning all activities
+        self._activity_idx = {a.id: i for i, a in enumerate(self.activities)}
+        self._pred_idx = [[self._activity_idx[pred_id] for pred_id in a.predecessors]
+                          for a in self.activities]
+        self._succ_idx = [[] for _ in range(n)]
+        for i, preds in enumerate(self._pred_idx):
+            for p in preds:
+                self._succ_idx[p].append(i)
+
+        # All (activity, resource) skill tests in one broadcast: signed
+        # surplus over the required skills, MATCH_INFEASIBLE where a
+        # required skill is missing, plus the positive-only surplus used
+        # for duration adjustment
+        self._resource_idx = {r.name: i for i, r in enumerate(self.resources)}
+        self._resource_cost = np.array([r.cost_per_hour for r in self.resources])
+        if self.activities and self.resources:
+            req = np.stack([a.req_vec for a in self.activities]).astype(np.int16)
+            held = np.stack([r.skill_vec for r in self.resources]).astype(np.int16)
+            need = req[:, None, :] > 0
+            diff = held[None, :, :] - req[:, None, :]
+            missing = (need & (held[None, :, :] == 0)).any(axis=2)
+            self._match_matrix = np.where(
+                missing, MATCH_INFEASIBLE, np.where(need, diff, 0).sum(axis=2))
+            self._surplus_matrix = np.where(need, np.maximum(diff, 0), 0).sum(axis=2)
+        else:
+            shape = (len(self.activities), len(self.resources))
+            self._match_matrix = np.full(shape, MATCH_INFEASIBLE, dtype=np.int16)
+            self._surplus_matrix = np.zeros(shape, dtype=np.int16)
+
     def calculate_activity_schedule(self) -> Dict:
         """
         Calculate start and end dates for all activities based on predecessors
         Uses forward pass of CPM (Critical Path Method)
-        
+
+        Runs a single Kahn topological pass over int32 day offsets: each
+        activity is scheduled once all its predecessors are, and relaxes
+        its successors' earliest starts - O(V+E), with no datetime objects
+        inside the loop. PROJECT_START is a Monday, so offset % 7 is the
+        weekday and the weekend snap is plain integer arithmetic.
+
         Returns:
-            Dictionary of activity schedules
+            Dictionary of activity schedules (materialized view)
         """
-        schedule = {}
-        
-        # Initialize all activities
-        for activity in self.activities:
-            schedule[activity.id] = {
-                'start': None,
-                'end': None,
-                'duration_days': activity.duration_days
-            }
-        
-        # Forward pass: calculate earliest start/end
-        max_iterations = len(self.activities) * 2  # Prevent infinite loops
-        iteration = 0
-        
-        while iteration < max_iterations:
-            iteration += 1
-            progress_made = False
-            
-            for activity in self.activities:
-                if schedule[activity.id]['start'] is not None:
-                    continue  # Already scheduled
-                
-                # Check if all predecessors are scheduled
-                predecessors_complete = True
-                latest_predecessor_end = PROJECT_START
-                
-                for pred_id in activity.predecessors:
-                    if schedule[pred_id]['end'] is None:
-                        predecessors_complete = False
-                        break
-                    latest_predecessor_end = max(latest_predecessor_end, schedule[pred_id]['end'])
-                
-                if predecessors_complete:
-                    # Schedule this activity
-                    start_date = latest_predecessor_end if activity.predecessors else PROJECT_START
-                    
-                    # Ensure start is a working day (Monday)
-                    while start_date.weekday() > 4:  # 5=Saturday, 6=Sunday
-                        start_date += timedelta(days=1)
-                    
-                    # Calculate end date (working days only)
-                    end_date = self._add_working_days(start_date, activity.duration_days)
-                    
-                    schedule[activity.id]['start'] = start_date
-                    schedule[activity.id]['end'] = end_date
-                    progress_made = True
-            
-            if not progress_made:
-                break  # All schedulable activities have been scheduled
-        
-        self.schedule = schedule
-        return schedule
-    
-    def _add_working_days(self, start_date: datetime, working_days: int) -> datetime:
+        n = len(self.activities)
+        dur = np.array([a.duration_days for a in self.activities], np.int32)
+        start_day = np.full(n, -1, np.int32)
+        end_day = np.full(n, -1, np.int32)
+        earliest = np.zeros(n, np.int32)
+        indegree = np.array([len(preds) for preds in self._pred_idx], np.int32)
+        ready = deque(i for i in range(n) if indegree[i] == 0)
+        topo_idx = []
+        project_end_off = 0
+
+        while ready:
+            i = ready.popleft()
+            topo_idx.append(i)
+            start = int(earliest[i])
+
+            # Ensure start is a working day (snap weekends to Monday)
+            weekday = start % 7  # 5=Saturday, 6=Sunday
+            if weekday > 4:
+                start += 7 - weekday
+
+            # Calculate end offset (working days only)
+            end = _end_offset(start, int(dur[i]))
+
+            start_day[i] = start
+            end_day[i] = end
+            if end > project_end_off:
+                project_end_off = end
+
+            # Relax successors; those with all predecessors done are ready
+            for j in self._succ_idx[i]:
+                if end > earliest[j]:
+                    earliest[j] = end
+                indegree[j] -= 1
+                if indegree[j] == 0:
+                    ready.append(j)
+
+        self._dur = dur
+        self._start_day = start_day
+        self._end_day = end_day
+        # Pop order is a topological order; the backward pass walks it in
+        # reverse instead of assuming ids are topologically sorted
+        self._topo_idx = topo_idx
+        # Running maximum kept during the pass, so later stages read an
+        # attribute instead of rescanning the schedule for the latest end
+        self.project_end = from_day_index(project_end_off)
+
+        # Week each activity starts in, recomputed alongside the schedule
+        # so the allocation loops read a dict instead of doing date math
+        # per (activity, resource) pair
+        self._activity_week = {
+            a.id: int(start_day[i]) // 7 + 1 if start_day[i] >= 0 else 1
+            for i, a in enumerate(self.activities)
+        }
+
+        self.schedule = self.schedule_dict()
+        return self.schedule
+
+    def schedule_dict(self) -> Dict:
         """
-        Add working days to a date (Monday-Friday only)
-        
-        Args:
-            start_date: Starting date
-            working_days: Number of working days to add
-            
+        Materialize the schedule arrays as the classic dict-of-dicts view
+
+        Downstream consumers (reports, XML/Excel generators) index by
+        activity id and field name; internally the allocator keeps day
+        offsets in parallel arrays.
+
         Returns:
-            End date after adding working days
+            {activity_id: {'start', 'end', 'duration_days'}} dictionary
         """
-        current_date = start_date
-        days_added = 0
-        
-        while days_added < working_days:
-            current_date += timedelta(days=1)
-            # Only count weekdays
-            if current_date.weekday() < 5:  # Monday=0, Friday=4
-                days_added += 1
-        
-        return current_date
+        return {
+            a.id: {
+                'start': from_day_index(self._start_day[i])
+                if self._start_day[i] >= 0 else None,
+                'end': from_day_index(self._end_day[i])
+                if self._end_day[i] >= 0 else None,
+                'duration_days': int(self._dur[i]),
+            }
+            for i, a in enumerate(self.activities)
+        }
     
     def allocate_resources(self, max_tasks_per_resource: int = 6,
                           duration_adjustment_factor: int = 2) -> Dict:
@@ -130,27 +254,31 @@ class ResourceAllocator:
         self.calculate_activity_schedule()
         
         # Step 2: Allocate resources to each activity
-        for activity in sorted(self.activities, key=lambda a: a.id):
-            print(f"\nAllocating resources for Activity {activity.id}: {activity.name}")
-            
+        for activity in sorted(self.activities, key=attrgetter('id')):
+            if self.verbose:
+                print(f"\nAllocating resources for Activity {activity.id}: {activity.name}")
+
             # Find best matching resources
             allocated = self._allocate_to_activity(activity, max_tasks_per_resource)
-            
+
             if allocated:
-                self.allocation_map[activity.id] = allocated
-                print(f"  ✓ Allocated: {', '.join([r.name for r in allocated])}")
-                
+                self._alloc_indices[self._activity_idx[activity.id]] = allocated
+                if self.verbose:
+                    print(f"  ✓ Allocated: {', '.join(self.resources[j].name for j in allocated)}")
+
                 # Adjust duration based on skill surplus
                 adjusted_duration = self._adjust_duration(
                     activity, allocated, duration_adjustment_factor
                 )
                 if adjusted_duration != activity.duration_days:
-                    print(f"  Duration adjusted: {activity.duration_days}d → {adjusted_duration}d")
+                    if self.verbose:
+                        print(f"  Duration adjusted: {activity.duration_days}d → {adjusted_duration}d")
                     activity.duration_days = adjusted_duration
-                    # Recalculate schedule with new duration
-                    self.calculate_activity_schedule()
+                    # Reschedule only the affected subtree, not everything
+                    self._reschedule_from(activity.id)
             else:
-                print(f"  ✗ WARNING: Could not allocate enough resources!")
+                if self.verbose:
+                    print(f"  ✗ WARNING: Could not allocate enough resources!")
                 # Assign whoever is available as fallback
                 self._allocate_fallback(activity, max_tasks_per_resource)
         
@@ -159,98 +287,212 @@ class ResourceAllocator:
         
         return results
     
-    def _allocate_to_activity(self, activity: Activity, max_tasks: int) -> List[Resource]:
+    def _reschedule_from(self, activity_id: int):
+        """
+        Incrementally update the schedule after one duration change
+
+        Walks the stored topological order and recomputes only the changed
+        activity and its (transitive) successors, instead of rebuilding the
+        whole schedule; activities whose dates come out unchanged stop the
+        propagation early.
+
+        Args:
+            activity_id: Activity whose duration_days was just modified
+        """
+        dirty = {self._activity_idx[activity_id]}
+        for i in self._topo_idx:
+            if i not in dirty:
+                continue
+            activity = self.activities[i]
+            preds = self._pred_idx[i]
+
+            start = max(int(self._end_day[p]) for p in preds) if preds else 0
+            weekday = start % 7
+            if weekday > 4:
+                start += 7 - weekday
+            end = _end_offset(start, activity.duration_days)
+
+            if (start == self._start_day[i] and end == self._end_day[i]
+                    and self._dur[i] == activity.duration_days):
+                continue
+
+            self._start_day[i] = start
+            self._end_day[i] = end
+            self._dur[i] = activity.duration_days
+            self._activity_week[activity.id] = start // 7 + 1
+            dirty.update(self._succ_idx[i])
+
+        # Ends may have moved either way; recompute the maximum once
+        self.project_end = from_day_index(int(self._end_day.max()))
+
+    def allocate_resources_matching(self, max_tasks_per_resource: int = 6,
+                                    duration_adjustment_factor: int = 2) -> Dict:
+        """
+        Alternative allocation via min-cost bipartite matching
+
+        Expands each activity into num_people slots and each resource into
+        max_tasks_per_resource capacity columns, then solves the whole
+        assignment in one Hungarian pass (scipy.optimize.linear_sum_assignment)
+        instead of greedy per-activity picks. Edge weight favours skill
+        surplus first and hourly cost second, like the greedy sort.
+
+        Falls back to the greedy allocator when SciPy is not installed.
+
+        Args:
+            max_tasks_per_resource: Maximum tasks a resource can be assigned to
+            duration_adjustment_factor: Hours per skill point for duration adjustment
+
+        Returns:
+            Allocation results dictionary
+        """
+        if not SCIPY_AVAILABLE:
+            print("! SciPy not available - using greedy allocation")
+            return self.allocate_resources(max_tasks_per_resource,
+                                           duration_adjustment_factor)
+
+        print("Starting resource allocation (bipartite matching)...")
+
+        self.calculate_activity_schedule()
+
+        # Rows: one slot per person needed per activity
+        slots = [activity for activity in sorted(self.activities, key=attrgetter('id'))
+                 for _ in range(activity.num_people)]
+        # Columns: each resource replicated per allowed task, enforcing
+        # the task limit structurally
+        columns = [resource for resource in self.resources
+                   for _ in range(max_tasks_per_resource)]
+
+        cost = np.full((len(slots), len(columns)), _INFEASIBLE_COST)
+        for i, activity in enumerate(slots):
+            activity_week = self._activity_week.get(activity.id, 1)
+            match_row = self._match_matrix[self._activity_idx[activity.id]]
+            for j, resource in enumerate(columns):
+                if not resource.avail_mask >> activity_week & 1:
+                    continue
+                score = int(match_row[self._resource_idx[resource.name]])
+                if score == MATCH_INFEASIBLE:
+                    continue
+                cost[i, j] = -score * _SURPLUS_WEIGHT + resource.cost_per_hour
+
+        row_ind, col_ind = linear_sum_assignment(cost)
+
+        # Translate solved pairs back into the allocation lists, skipping
+        # slots the solver could only fill with an infeasible edge
+        for i, j in zip(row_ind, col_ind):
+            if cost[i, j] >= _INFEASIBLE_COST:
+                continue
+            activity, resource = slots[i], columns[j]
+            r_idx = self._resource_idx[resource.name]
+            allocated = self._alloc_indices[self._activity_idx[activity.id]]
+            if r_idx in allocated:
+                continue
+            allocated.append(r_idx)
+            resource.assigned_tasks.append(activity.id)
+
+        for activity in sorted(self.activities, key=attrgetter('id')):
+            allocated = self._alloc_indices[self._activity_idx[activity.id]]
+            if allocated:
+                if self.verbose:
+                    print(f"  ✓ Activity {activity.id}: "
+                          f"{', '.join(self.resources[j].name for j in allocated)}")
+                adjusted_duration = self._adjust_duration(
+                    activity, allocated, duration_adjustment_factor
+                )
+                if adjusted_duration != activity.duration_days:
+                    activity.duration_days = adjusted_duration
+            else:
+                if self.verbose:
+                    print(f"  ✗ WARNING: no feasible resources for Activity {activity.id}!")
+                self._allocate_fallback(activity, max_tasks_per_resource)
+
+        # One schedule rebuild after all duration adjustments
+        self.calculate_activity_schedule()
+
+        return self._calculate_results()
+
+    def _allocate_to_activity(self, activity: Activity, max_tasks: int) -> List[int]:
         """
         Allocate best matching resources to an activity
-        
+
         Args:
             activity: Activity to allocate resources to
             max_tasks: Maximum tasks per resource
-            
+
         Returns:
-            List of allocated resources
+            List of allocated resource indices
         """
-        # Get activity week(s)
-        schedule = self.schedule.get(activity.id)
-        if not schedule or not schedule['start']:
-            activity_week = 1
-        else:
-            delta = schedule['start'] - PROJECT_START
-            activity_week = (delta.days // 7) + 1
-        
+        activity_week = self._activity_week.get(activity.id, 1)
+        match_row = self._match_matrix[self._activity_idx[activity.id]]
+
         # Find candidate resources
         candidates = []
-        for resource in self.resources:
-            # Check availability
-            if not resource.is_available(activity_week):
+        for idx, resource in enumerate(self.resources):
+            # Check availability (one shift-and-mask on the precomputed
+            # vacation bitmask)
+            if not resource.avail_mask >> activity_week & 1:
                 continue
-            
+
             # Check task limit
             if not resource.can_take_task(max_tasks):
                 continue
-            
-            # Check skill match
-            matches, surplus = resource.matches_skills(activity.skill_requirements)
-            if matches:
-                candidates.append({
-                    'resource': resource,
-                    'surplus': surplus,
-                    'cost': resource.cost_per_hour
-                })
-        
+
+            # Check skill match via the precomputed matrix row
+            # (MATCH_INFEASIBLE means a required skill is missing)
+            score = int(match_row[idx])
+            if score != MATCH_INFEASIBLE:
+                candidates.append((-score, resource.cost_per_hour, idx, resource))
+
         if not candidates:
             return []
-        
-        # Sort by: 1) skill surplus (descending), 2) cost (ascending)
-        candidates.sort(key=lambda x: (-x['surplus'], x['cost']))
-        
+
+        # Sort by: 1) skill surplus (descending), 2) cost (ascending); the
+        # keyless tuple sort compares entirely in C, with the list index as
+        # the tie-break so order stays stable
+        candidates.sort()
+
         # Allocate top N resources
         allocated = []
-        for i in range(min(activity.num_people, len(candidates))):
-            resource = candidates[i]['resource']
-            allocated.append(resource)
-            resource.assigned_tasks.append(activity.id)
-        
+        for candidate in candidates[:min(activity.num_people, len(candidates))]:
+            allocated.append(candidate[2])
+            candidate[3].assigned_tasks.append(activity.id)
+
         return allocated
     
     def _allocate_fallback(self, activity: Activity, max_tasks: int):
         """Fallback allocation when normal allocation fails"""
-        schedule = self.schedule.get(activity.id)
-        activity_week = 1 if not schedule or not schedule['start'] else \
-                       ((schedule['start'] - PROJECT_START).days // 7) + 1
-        
+        activity_week = self._activity_week.get(activity.id, 1)
+
         allocated = []
-        for resource in self.resources:
+        for idx, resource in enumerate(self.resources):
             if len(allocated) >= activity.num_people:
                 break
-            if resource.is_available(activity_week) and resource.can_take_task(max_tasks):
-                allocated.append(resource)
+            if (resource.avail_mask >> activity_week & 1
+                    and resource.can_take_task(max_tasks)):
+                allocated.append(idx)
                 resource.assigned_tasks.append(activity.id)
-        
+
         if allocated:
-            self.allocation_map[activity.id] = allocated
-            print(f"  ! Fallback allocated: {', '.join([r.name for r in allocated])}")
+            self._alloc_indices[self._activity_idx[activity.id]] = allocated
+            if self.verbose:
+                print(f"  ! Fallback allocated: "
+                      f"{', '.join(self.resources[j].name for j in allocated)}")
     
-    def _adjust_duration(self, activity: Activity, allocated_resources: List[Resource],
+    def _adjust_duration(self, activity: Activity, allocated_indices: List[int],
                         factor: int) -> int:
         """
         Adjust activity duration based on resource skill surplus
-        
+
         Args:
             activity: The activity
-            allocated_resources: Allocated resources
+            allocated_indices: Indices of the allocated resources
             factor: Hours per skill point difference
-            
+
         Returns:
             Adjusted duration in days
         """
-        # Calculate total skill surplus
-        total_surplus = 0
-        for resource in allocated_resources:
-            for skill, required_level in activity.skill_requirements.items():
-                if required_level > 0:
-                    resource_level = resource.skills.get(skill, 0)
-                    total_surplus += max(0, resource_level - required_level)
+        # Total positive skill surplus, read from the precomputed matrix
+        surplus_row = self._surplus_matrix[self._activity_idx[activity.id]]
+        total_surplus = int(surplus_row[allocated_indices].sum())
         
         # Calculate adjustment
         base_hours = activity. num_people * activity.duration_days * HOURS_PER_DAY
@@ -271,29 +513,31 @@ class ResourceAllocator:
         total_cost = 0
         activity_costs = {}
         
-        for activity in self.activities:
-            allocated = self.allocation_map.get(activity.id, [])
-            
+        for i, activity in enumerate(self.activities):
+            allocated = self._alloc_indices[i]
+
             if not allocated:
                 activity_costs[activity.id] = 0
                 continue
-            
+
             # Calculate hours per resource
-            hours_per_resource = (activity.duration_days * HOURS_PER_DAY) / len(allocated) if allocated else 0
-            
-            # Calculate cost
-            activity_cost = sum(r.cost_per_hour * hours_per_resource for r in allocated)
+            hours_per_resource = (activity.duration_days * HOURS_PER_DAY) / len(allocated)
+
+            # Per-resource costs from the rate vector, summed in C
+            resource_costs = self._resource_cost[allocated] * hours_per_resource
+            activity_cost = float(resource_costs.sum())
             activity_costs[activity.id] = activity_cost
             total_cost += activity_cost
-            
+
             # Update resource totals
-            for resource in allocated:
+            for j, cost in zip(allocated, resource_costs):
+                resource = self.resources[j]
                 resource.total_hours += hours_per_resource
-                resource.total_cost += resource.cost_per_hour * hours_per_resource
+                resource.total_cost += cost
         
         # Add core team fixed costs
         # Core team works 8h/day for entire project duration
-        project_days = (max(s['end'] for s in self.schedule.values() if s['end']) - PROJECT_START).days
+        project_days = (self.project_end - PROJECT_START).days
         project_working_days = project_days * (5/7)  # Approximate working days
         
         core_team_cost = 0
@@ -308,8 +552,11 @@ class ResourceAllocator:
         total_cost += core_team_cost
         
         # Get completion date
-        completion_date = max(s['end'] for s in self.schedule.values() if s['end'])
-        
+        completion_date = self.project_end
+
+        # Materialize the dict views from the arrays once, at the boundary
+        self.schedule = self.schedule_dict()
+
         results = {
             'total_activities': len(self.activities),
             'total_resources': len([r for r in self.resources if r.assigned_tasks or r.is_core_team]),
@@ -318,13 +565,16 @@ class ResourceAllocator:
             'activity_costs': activity_costs,
             'completion_date': completion_date,
             'schedule': self.schedule,
-            'allocation_map': {aid: [r.name for r in resources] 
-                             for aid, resources in self.allocation_map.items()},
+            'allocation_map': {a.id: [self.resources[j].name for j in self._alloc_indices[i]]
+                               for i, a in enumerate(self.activities)
+                               if self._alloc_indices[i]},
+            # Sorted by cost (descending) so report code can iterate directly
             'resource_utilization': {r.name: {
                 'hours': r.total_hours,
                 'cost': r.total_cost,
                 'tasks': len(r.assigned_tasks)
-            } for r in self.resources if r.total_hours > 0}
+            } for r in sorted((r for r in self.resources if r.total_hours > 0),
+                              key=attrgetter('total_cost'), reverse=True)}
         }
         
         return results
@@ -336,52 +586,43 @@ class ResourceAllocator:
         Returns:
             List of activity IDs on critical path
         """
-        # Calculate latest start/finish times (backward pass)
-        latest_finish = {}
-        project_end = max(s['end'] for s in self.schedule.values() if s['end'])
-        
-        # Initialize
-        for activity in self.activities:
-            latest_finish[activity.id] = project_end
-        
-        # Backward pass
-        for activity in sorted(self.activities, key=lambda a: -a.id):
-            # Find minimum latest start of successors
-            successors = [a for a in self.activities if activity.id in a.predecessors]
-            
+        # Sinks finish at project end
+        project_end_off = to_day_index(self.project_end)
+        latest_finish = np.full(len(self.activities), project_end_off, np.int32)
+
+        # Backward pass: reverse topological order over the precomputed
+        # successor lists, one relaxation per edge - O(V+E), on day offsets
+        for i in reversed(self._topo_idx):
+            successors = self._succ_idx[i]
             if successors:
-                min_successor_start = min(
-                    latest_finish[s.id] - timedelta(days=self.schedule[s.id]['duration_days'])
-                    for s in successors
-                )
-                activity_duration = timedelta(days=self.schedule[activity.id]['duration_days'])
-                latest_finish[activity.id] = min_successor_start
-            else:
-                latest_finish[activity.id] = project_end
-        
+                latest_finish[i] = min(int(latest_finish[j]) - int(self._dur[j])
+                                       for j in successors)
+
         # Identify critical activities (earliest start = latest start)
         critical_path = []
-        for activity in self.activities:
-            earliest_start = self.schedule[activity.id]['start']
-            latest_start = latest_finish[activity.id] - timedelta(
-                days=self.schedule[activity.id]['duration_days']
-            )
+        for i, activity in enumerate(self.activities):
+            earliest_start = (int(self._start_day[i])
+                              if self._start_day[i] >= 0 else None)
+            latest_start = int(latest_finish[i]) - int(self._dur[i])
             
             # If dates match (or very close), it's on critical path
-            if earliest_start and abs((earliest_start - latest_start).days) <= 1:
+            if earliest_start is not None and abs(earliest_start - latest_start) <= 1:
                 critical_path.append(activity.id)
         
         return sorted(critical_path)
 
 
-def run_allocation() -> Tuple[ResourceAllocator, Dict]:
+def run_allocation(verbose: bool = True) -> Tuple[ResourceAllocator, Dict]:
     """
     Run the complete resource allocation process
-    
+
+    Args:
+        verbose: Print per-activity allocation progress (CLI default)
+
     Returns:
         Tuple of (allocator instance, results dictionary)
     """
-    allocator = ResourceAllocator(ACTIVITIES, RESOURCES)
+    allocator = ResourceAllocator(ACTIVITIES, RESOURCES, verbose=verbose)
     results = allocator.allocate_resources()
     
     # Print summary
@@ -411,11 +652,7 @@ if __name__ == "__main__":
     print("RESOURCE UTILIZATION")
     print("="*70)
     
-    for resource_name, util in sorted(
-        results['resource_utilization'].items(),
-        key=lambda x: x[1]['cost'],
-        reverse=True
-    ):
+    for resource_name, util in results['resource_utilization'].items():
         print(f"\n{resource_name}:")
         print(f"  Hours: {util['hours']:.1f}")
         print(f"  Cost: €{util['cost']:,.2f}")
@@ -4,33 +4,54 @@ Analyzes project risks and optimizes mitigation strategies
 """
 
 from typing import List, Dict, Tuple, Optional
-import itertools
+
+import numpy as np
+
 from data_models import Risk, RISKS, get_activity_by_id
 
+# Value assigned to a day of expected schedule slip avoided by a
+# mitigation when scoring options against their cost
+TIME_VALUE_PER_DAY = 1000
+
 
 class RiskAnalyzer:
     """Analyzes and manages project risks"""
     
-    def __init__(self, risks: List[Risk]):
+    def __init__(self, risks: List[Risk], verbose: bool = False):
         """
         Initialize risk analyzer
-        
+
         Args:
             risks: List of identified risks
+            verbose: Print per-risk optimization details
         """
+        self.verbose = verbose
         self.risks = risks
         self.mitigation_selections = {}
-    
+        # Parallel arrays of the immutable risk fields, so the scenario
+        # aggregates run as vector ops instead of per-risk attribute loads
+        self._prob = np.array([r.probability for r in risks])
+        self._cost = np.array([r.cost_impact for r in risks])
+        self._time = np.array([r.time_impact_days for r in risks])
+
+    def _reduction_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Cost/time reductions of the selected mitigations (0 where none)"""
+        cost_red = np.array([r.selected_mitigation['cost_reduction']
+                             if r.selected_mitigation else 0 for r in self.risks])
+        time_red = np.array([r.selected_mitigation['time_reduction']
+                             if r.selected_mitigation else 0 for r in self.risks])
+        return cost_red, time_red
+
     def calculate_worst_case(self) -> Dict:
         """
         Calculate worst-case scenario (all risks occur)
-        
+
         Returns:
             Dictionary with worst-case impact
         """
-        total_cost_impact = sum(r.cost_impact for r in self.risks)
-        total_time_impact = sum(r.time_impact_days for r in self.risks)
-        
+        total_cost_impact = int(self._cost.sum())
+        total_time_impact = int(self._time.sum())
+
         return {
             'total_cost': total_cost_impact,
             'total_time_days': total_time_impact,
@@ -44,9 +65,9 @@ class RiskAnalyzer:
         Returns:
             Dictionary with expected values
         """
-        total_expected_cost = sum(r.expected_value() for r in self.risks)
-        total_expected_time = sum(r.probability * r.time_impact_days for r in self.risks)
-        
+        total_expected_cost = float((self._prob * self._cost).sum())
+        total_expected_time = float((self._prob * self._time).sum())
+
         return {
             'total_expected_cost': total_expected_cost,
             'total_expected_time': total_expected_time,
@@ -57,67 +78,59 @@ class RiskAnalyzer:
     def optimize_mitigation_strategy(self, budget_constraint: Optional[float] = None) -> Dict:
         """
         Optimize mitigation strategy selection to minimize total expected cost
-        
+
+        The net benefit is a sum of independent per-risk terms, so without
+        a budget the optimum is simply the best option per risk - O(Σk)
+        instead of enumerating all O(Πk) combinations. With a budget the
+        problem becomes a group knapsack, solved exactly by a DP over
+        achievable cost totals.
+
         Args:
             budget_constraint: Maximum mitigation budget (optional)
-            
+
         Returns:
             Dictionary with optimal mitigation strategy
         """
         print("\nOptimizing risk mitigation strategy...")
-        
+
+        # Net contribution of each option: expected benefit minus cost
+        contributions = [
+            [(risk.probability * (option['cost_reduction'] +
+                                  option['time_reduction'] * TIME_VALUE_PER_DAY)
+              - option['cost'], option)
+             for option in risk.mitigation_options]
+            for risk in self.risks
+        ]
+        total_options = sum(len(options) for options in contributions)
+        print(f"Evaluating {total_options} mitigation options across {len(self.risks)} risks...")
+
+        if budget_constraint:
+            selection = self._knapsack_select(contributions, budget_constraint)
+        else:
+            # Independent argmax per risk (first option wins ties, matching
+            # the order the old exhaustive search visited combinations in)
+            selection = [max(options, key=lambda c: c[0])[1]
+                         for options in contributions]
+
         best_strategy = None
-        best_net_benefit = float('-inf')
-        
-        # Try all combinations of mitigation options
-        mitigation_combinations = []
-        for risk in self.risks:
-            mitigation_combinations.append(risk.mitigation_options)
-        
-        # Generate all possible combinations
-        total_combinations = 1
-        for options in mitigation_combinations:
-            total_combinations *= len(options)
-        
-        print(f"Evaluating {total_combinations} possible mitigation combinations...")
-        
-        for combination in itertools.product(*mitigation_combinations):
-            # Calculate total cost and benefit
-            total_cost = sum(opt['cost'] for opt in combination)
-            
-            # Check budget constraint
-            if budget_constraint and total_cost > budget_constraint:
-                continue
-            
-            # Calculate expected cost reduction
-            total_cost_reduction = 0
-            total_time_reduction = 0
-            
-            for i, (risk, mitigation) in enumerate(zip(self.risks, combination)):
-                # Expected benefit = probability × (cost_reduction + time_reduction_value)
-                # For simplicity, we'll value time reduction at €1000/day
-                time_value = 1000
-                
-                expected_benefit = risk.probability * (
-                    mitigation['cost_reduction'] + 
-                    mitigation['time_reduction'] * time_value
-                )
-                total_cost_reduction += expected_benefit
-                total_time_reduction += risk.probability * mitigation['time_reduction']
-            
-            # Net benefit = benefit - cost
-            net_benefit = total_cost_reduction - total_cost
-            
-            if net_benefit > best_net_benefit:
-                best_net_benefit = net_benefit
-                best_strategy = {
-                    'mitigations': list(combination),
-                    'total_cost': total_cost,
-                    'expected_reduction': total_cost_reduction,
-                    'expected_time_reduction': total_time_reduction,
-                    'net_benefit': net_benefit
-                }
-        
+        if selection is not None:
+            total_cost = sum(option['cost'] for option in selection)
+            total_cost_reduction = sum(
+                risk.probability * (option['cost_reduction'] +
+                                    option['time_reduction'] * TIME_VALUE_PER_DAY)
+                for risk, option in zip(self.risks, selection))
+            total_time_reduction = sum(
+                risk.probability * option['time_reduction']
+                for risk, option in zip(self.risks, selection))
+
+            best_strategy = {
+                'mitigations': selection,
+                'total_cost': total_cost,
+                'expected_reduction': total_cost_reduction,
+                'expected_time_reduction': total_time_reduction,
+                'net_benefit': total_cost_reduction - total_cost
+            }
+
         if best_strategy:
             # Store selections
             for i, (risk, mitigation) in enumerate(zip(self.risks, best_strategy['mitigations'])):
@@ -129,14 +142,53 @@ class RiskAnalyzer:
             print(f"  Expected reduction: €{best_strategy['expected_reduction']:,.2f}")
             print(f"  Net benefit: €{best_strategy['net_benefit']:,.2f}")
             
-            for risk, mitigation in zip(self.risks, best_strategy['mitigations']):
-                print(f"\n  Risk {risk.id} ({risk.name}):")
-                print(f"    Selected: {mitigation['id']} - {mitigation['name']}")
-                print(f"    Cost: €{mitigation['cost']:,.2f}")
-                print(f"    Reduces: €{mitigation['cost_reduction']:,.2f}, {mitigation['time_reduction']}d")
+            if self.verbose:
+                for risk, mitigation in zip(self.risks, best_strategy['mitigations']):
+                    print(f"\n  Risk {risk.id} ({risk.name}):")
+                    print(f"    Selected: {mitigation['id']} - {mitigation['name']}")
+                    print(f"    Cost: €{mitigation['cost']:,.2f}")
+                    print(f"    Reduces: €{mitigation['cost_reduction']:,.2f}, {mitigation['time_reduction']}d")
         
         return best_strategy
-    
+
+    @staticmethod
+    def _knapsack_select(contributions: List[List[Tuple[float, Dict]]],
+                         budget: float) -> Optional[List[Dict]]:
+        """
+        Pick one option per risk maximizing net benefit within a budget
+
+        Group-knapsack DP over achievable cost totals: dominated states
+        (same cost, lower benefit) are pruned after each risk, so the
+        state count stays bounded by the distinct cost sums.
+
+        Args:
+            contributions: Per-risk list of (net_contribution, option)
+            budget: Maximum total mitigation cost
+
+        Returns:
+            Selected options, or None if no combination fits the budget
+        """
+        # state: total cost -> (net benefit, options chosen so far)
+        states = {0: (0.0, ())}
+
+        for options in contributions:
+            next_states = {}
+            for cost, (benefit, chosen) in states.items():
+                for contribution, option in options:
+                    new_cost = cost + option['cost']
+                    if new_cost > budget:
+                        continue
+                    new_benefit = benefit + contribution
+                    current = next_states.get(new_cost)
+                    if current is None or new_benefit > current[0]:
+                        next_states[new_cost] = (new_benefit, chosen + (option,))
+            if not next_states:
+                return None
+            states = next_states
+
+        _, best_selection = max(states.values(), key=lambda s: s[0])
+        return list(best_selection)
+
     def calculate_residual_risk(self) -> Dict:
         """
         Calculate residual risk after mitigation
@@ -144,29 +196,16 @@ class RiskAnalyzer:
         Returns:
             Dictionary with residual risk values
         """
-        total_residual_cost = 0
-        total_residual_time = 0
-        
-        for risk in self.risks:
-            if risk.selected_mitigation:
-                # Residual impact = original impact - mitigation reduction
-                residual_cost = max(0, risk.cost_impact - risk.selected_mitigation['cost_reduction'])
-                residual_time = max(0, risk.time_impact_days - risk.selected_mitigation['time_reduction'])
-                
-                # Expected residual value
-                expected_residual_cost = risk.probability * residual_cost
-                expected_residual_time = risk.probability * residual_time
-            else:
-                # No mitigation - full risk remains
-                expected_residual_cost = risk.expected_value()
-                expected_residual_time = risk.probability * risk.time_impact_days
-            
-            total_residual_cost += expected_residual_cost
-            total_residual_time += expected_residual_time
-        
+        # Residual impact = original impact - mitigation reduction (zero
+        # reduction where no mitigation was selected), floored at 0 and
+        # probability-weighted in one vector expression
+        cost_red, time_red = self._reduction_arrays()
+        residual_cost = np.maximum(0, self._cost - cost_red)
+        residual_time = np.maximum(0, self._time - time_red)
+
         return {
-            'expected_cost': total_residual_cost,
-            'expected_time_days': total_residual_time
+            'expected_cost': float((self._prob * residual_cost).sum()),
+            'expected_time_days': float((self._prob * residual_time).sum())
         }
     
     def generate_risk_register(self) -> List[Dict]:
@@ -218,43 +257,45 @@ class RiskAnalyzer:
         Returns:
             Formatted summary text
         """
-        summary = "RISK MITIGATION SUMMARY\n"
-        summary += "="*70 + "\n\n"
-        
+        # Collect fragments and join once - avoids quadratic str +=
+        parts = ["RISK MITIGATION SUMMARY\n", "="*70 + "\n\n"]
+
         for risk in self.risks:
-            summary += f"Risk {risk.id}: {risk.name}\n"
-            summary += f"  Activity: {risk.activity_id}\n"
-            summary += f"  Probability: {risk.probability*100}%\n"
-            summary += f"  Impact: €{risk.cost_impact:,} / {risk.time_impact_days} days\n"
-            summary += f"  Expected Value: €{risk.expected_value():,.2f}\n"
-            
+            parts.append(f"Risk {risk.id}: {risk.name}\n")
+            parts.append(f"  Activity: {risk.activity_id}\n")
+            parts.append(f"  Probability: {risk.probability*100}%\n")
+            parts.append(f"  Impact: €{risk.cost_impact:,} / {risk.time_impact_days} days\n")
+            parts.append(f"  Expected Value: €{risk.expected_value():,.2f}\n")
+
             if risk.selected_mitigation:
                 mit = risk.selected_mitigation
-                summary += f"\n  Selected Mitigation: {mit['id']} - {mit['name']}\n"
-                summary += f"    Cost: €{mit['cost']:,}\n"
-                summary += f"    Reduces Impact: €{mit['cost_reduction']:,} / {mit['time_reduction']} days\n"
-                
+                parts.append(f"\n  Selected Mitigation: {mit['id']} - {mit['name']}\n")
+                parts.append(f"    Cost: €{mit['cost']:,}\n")
+                parts.append(f"    Reduces Impact: €{mit['cost_reduction']:,} / {mit['time_reduction']} days\n")
+
                 residual_cost = max(0, risk.cost_impact - mit['cost_reduction'])
-                summary += f"    Residual Risk: €{risk.probability * residual_cost:,.2f} expected\n"
+                parts.append(f"    Residual Risk: €{risk.probability * residual_cost:,.2f} expected\n")
             else:
-                summary += f"\n  No mitigation selected (accepting risk)\n"
-            
-            summary += "\n"
-        
-        return summary
+                parts.append(f"\n  No mitigation selected (accepting risk)\n")
+
+            parts.append("\n")
+
+        return "".join(parts)
 
 
-def run_risk_analysis(budget_constraint: Optional[float] = None) -> Tuple[RiskAnalyzer, Dict]:
+def run_risk_analysis(budget_constraint: Optional[float] = None,
+                      verbose: bool = True) -> Tuple[RiskAnalyzer, Dict]:
     """
     Run complete risk analysis
-    
+
     Args:
         budget_constraint: Optional budget limit for mitigations
-        
+        verbose: Print per-risk optimization details (CLI default)
+
     Returns:
         Tuple of (analyzer instance, analysis results)
     """
-    analyzer = RiskAnalyzer(RISKS)
+    analyzer = RiskAnalyzer(RISKS, verbose=verbose)
     
     print("ProDegeit Risk Analysis")
     print("="*70)